@@ -90,6 +90,11 @@ class Config:
         """Set a configuration value and save"""
         self.config[key] = value
         self.save()
+    
+    def update(self, values):
+        """Set several configuration values and save once"""
+        self.config.update(values)
+        self.save()
         
     def _detect_java_path(self):
         """Try to detect Java installation path"""
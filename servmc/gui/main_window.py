@@ -132,11 +132,11 @@ class MainWindow:
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
         help_menu.add_command(label="🚀 Getting Started Tutorial", 
-                             command=lambda: self.tutorial_help["tutorial_manager"].start_tutorial("getting_started"))
+                             command=lambda: self.tutorial_help["start_tutorial"]("getting_started"))
         help_menu.add_command(label="📚 All Tutorials", 
                              command=self.tutorial_help["show_tutorials"])
         help_menu.add_command(label="🎯 Quick Start Guide", 
-                             command=lambda: self.tutorial_help["tutorial_manager"].show_quick_start(None))
+                             command=self.tutorial_help["show_quick_start"])
         help_menu.add_separator()
         help_menu.add_command(label="Documentation", command=lambda: webbrowser.open("https://github.com/servmc/docs"))
         help_menu.add_command(label="Mod Installation Guide", command=self.show_mod_guide)
@@ -786,7 +786,7 @@ GAMEPLAY ENHANCEMENT:
             tutorial_button = ttk.Button(
                 tutorial_frame, 
                 text=button_text,
-                command=lambda: self.tutorial_help["tutorial_manager"].start_tutorial(tutorial_name)
+                command=lambda: self.tutorial_help["start_tutorial"](tutorial_name)
             )
             tutorial_button.pack(side=tk.RIGHT)
         except Exception as e:
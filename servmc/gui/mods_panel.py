@@ -43,7 +43,7 @@ class ModsPanel:
             tutorial_button = ttk.Button(
                 tutorial_frame,
                 text="🔧 Mod Management Tutorial",
-                command=lambda: tutorial_help["tutorial_manager"].start_tutorial("mod_management")
+                command=lambda: tutorial_help["start_tutorial"]("mod_management")
             )
             tutorial_button.pack(side=tk.RIGHT)
             
@@ -31,7 +31,7 @@ class NetworkPanel:
             tutorial_button = ttk.Button(
                 tutorial_frame,
                 text="🌐 Network Configuration Tutorial",
-                command=lambda: tutorial_help["tutorial_manager"].start_tutorial("network_diagnostics")
+                command=lambda: tutorial_help["start_tutorial"]("network_diagnostics")
             )
             tutorial_button.pack(side=tk.RIGHT)
             
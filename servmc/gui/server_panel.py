@@ -52,8 +52,9 @@ class ServerPanel:
         button_frame = ttk.Frame(left_frame)
         button_frame.pack(fill=tk.X, pady=10)
         
-        ttk.Button(button_frame, text="New Server", 
-                   command=self.show_create_server_dialog).pack(side=tk.LEFT, padx=(0, 5))
+        self.new_server_button = ttk.Button(button_frame, text="New Server", 
+                                            command=self.show_create_server_dialog)
+        self.new_server_button.pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="Delete", 
                    command=self.delete_server).pack(side=tk.LEFT)
         
@@ -231,7 +232,7 @@ class ServerPanel:
             tutorial_button = ttk.Button(
                 tutorial_frame,
                 text="🎯 Server Management Tutorial",
-                command=lambda: tutorial_help["tutorial_manager"].start_tutorial("server_management")
+                command=lambda: tutorial_help["start_tutorial"]("server_management")
             )
             tutorial_button.pack(side=tk.RIGHT)
             
@@ -27,7 +27,7 @@ class SettingsPanel:
             tutorial_button = ttk.Button(
                 tutorial_frame,
                 text="⚙️ Settings Configuration Tutorial",
-                command=lambda: tutorial_help["tutorial_manager"].start_tutorial("settings_configuration")
+                command=lambda: tutorial_help["start_tutorial"]("settings_configuration")
             )
             tutorial_button.pack(side=tk.RIGHT)
             
@@ -1977,7 +1977,12 @@ Most mods store their configs in the `config/` folder. Check individual mod wiki
                     for file in files:
                         file_path = os.path.join(root, file)
                         arcname = os.path.relpath(file_path, instance_dir)
-                        zipf.write(file_path, arcname)
+                        # Mod jars are zips already; deflating them again
+                        # only costs time when the instance is zipped
+                        if file.lower().endswith(('.jar', '.zip')):
+                            zipf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+                        else:
+                            zipf.write(file_path, arcname)
             
             print(f"MultiMC instance zip created: {zip_path}")
             
@@ -3,32 +3,61 @@ Interactive Tutorial System for ServMC
 """
 
 import os
+from collections import namedtuple
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
+import tkinter.font as tkfont
+from functools import partial
 from typing import Dict, List, Callable, Optional
 
 
-class TutorialManager:
-    """Manages interactive tutorials for ServMC"""
+def _make_scrolled_text(parent, content: str, pad: int = 5, **text_options):
+    """Create a read-only, vertically scrollable text view.
     
-    def __init__(self, main_window):
-        self.main_window = main_window
-        self.current_tutorial = None
-        self.tutorial_data = self._load_tutorials()
-        
-    def _load_tutorials(self) -> Dict:
-        """Load tutorial definitions"""
-        return {
-            "getting_started": {
-                "title": "🚀 Getting Started with ServMC",
-                "description": "Learn the basics of ServMC and create your first server",
-                "duration": "5 minutes",
-                "steps": [
-                    {
-                        "title": "Welcome to ServMC!",
-                        "content": """Welcome to ServMC - your complete Minecraft server management solution!
+    A disabled Text keeps mouse-wheel scrolling and text selection/copy;
+    the content is inserted once and undo is off, so no edit history is
+    kept. Returns (text, frame); the caller packs the frame.
+    """
+    frame = ttk.Frame(parent)
+    text = tk.Text(frame, wrap=tk.WORD, undo=False, **text_options)
+    scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=text.yview)
+    text.configure(yscrollcommand=scrollbar.set)
+    
+    text.insert(tk.END, content)
+    text.config(state=tk.DISABLED)
+    
+    text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=pad, pady=pad)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    return text, frame
+
+
+# Shared Font objects, created on first use (a Tk root must exist by then)
+_FONTS = {}
+
+
+def _font(size: int, weight: str = "normal") -> tkfont.Font:
+    """Return the shared Arial font for the given size and weight"""
+    key = (size, weight)
+    if key not in _FONTS:
+        _FONTS[key] = tkfont.Font(family="Arial", size=size, weight=weight)
+    return _FONTS[key]
+
+
+# A single tutorial step; action names are dispatched by TutorialWindow
+Step = namedtuple("Step", ["title", "content", "action", "highlight_area", "wait_for_action"],
+                  defaults=[None, None, False])
+
+
+# Tutorial definitions, built once at import and shared by every TutorialManager
+TUTORIALS = {
+    "getting_started": {
+        "title": "🚀 Getting Started with ServMC",
+        "description": "Learn the basics of ServMC and create your first server",
+        "duration": "5 minutes",
+        "steps": [
+            Step(
+                title="Welcome to ServMC!",
+                content="""Welcome to ServMC - your complete Minecraft server management solution!
 
 This tutorial will guide you through:
 • Creating your first server
@@ -37,12 +66,12 @@ This tutorial will guide you through:
 • Essential settings
 
 Let's get started! 🎮""",
-                        "action": "highlight_main_window",
-                        "highlight_area": "main"
-                    },
-                    {
-                        "title": "Understanding the Interface",
-                        "content": """ServMC has four main tabs:
+                action="highlight_main_window",
+                highlight_area="main"
+            ),
+            Step(
+                title="Understanding the Interface",
+                content="""ServMC has four main tabs:
 
 🎮 Servers - Create and manage your Minecraft servers
 🔧 Mods & Types - Browse and install mods
@@ -50,25 +79,25 @@ Let's get started! 🎮""",
 ⚙️ Settings - Application preferences
 
 The status bar at the bottom shows server status and alerts.""",
-                        "action": "highlight_tabs",
-                        "highlight_area": "notebook"
-                    },
-                    {
-                        "title": "Creating Your First Server",
-                        "content": """Let's create a new Minecraft server!
+                action="highlight_tabs",
+                highlight_area="notebook"
+            ),
+            Step(
+                title="Creating Your First Server",
+                content="""Let's create a new Minecraft server!
 
 1. Make sure you're on the Servers tab
 2. Click the "New Server" button
 3. We'll walk through the server creation process
 
 Ready? Click "Next" and then click "New Server"!""",
-                        "action": "highlight_new_server_button",
-                        "highlight_area": "new_server_button",
-                        "wait_for_action": True
-                    },
-                    {
-                        "title": "Server Configuration",
-                        "content": """The server creation dialog lets you configure:
+                action="highlight_new_server_button",
+                highlight_area="new_server_button",
+                wait_for_action=True
+            ),
+            Step(
+                title="Server Configuration",
+                content="""The server creation dialog lets you configure:
 
 • Server Name - A unique name for your server
 • Server Type - Vanilla, Forge, Fabric, Paper, etc.
@@ -78,12 +107,12 @@ Ready? Click "Next" and then click "New Server"!""",
 • Game Mode - Survival, Creative, etc.
 
 Fill in the details and click "Create"!""",
-                        "action": "highlight_server_dialog",
-                        "highlight_area": "dialog"
-                    },
-                    {
-                        "title": "Server Management",
-                        "content": """Once your server is created, you can:
+                action="highlight_server_dialog",
+                highlight_area="dialog"
+            ),
+            Step(
+                title="Server Management",
+                content="""Once your server is created, you can:
 
 • Start/Stop the server
 • View real-time logs
@@ -92,20 +121,20 @@ Fill in the details and click "Create"!""",
 • Install mods
 
 Select your server from the list to see these options.""",
-                        "action": "highlight_server_panel",
-                        "highlight_area": "server_details"
-                    }
-                ]
-            },
-            
-            "mod_management": {
-                "title": "🔧 Mod Management Guide",
-                "description": "Learn how to search, install, and manage mods",
-                "duration": "7 minutes",
-                "steps": [
-                    {
-                        "title": "Introduction to Mod Management",
-                        "content": """ServMC makes mod management incredibly easy!
+                action="highlight_server_panel",
+                highlight_area="server_details"
+            )
+        ]
+    },
+
+    "mod_management": {
+        "title": "🔧 Mod Management Guide",
+        "description": "Learn how to search, install, and manage mods",
+        "duration": "7 minutes",
+        "steps": [
+            Step(
+                title="Introduction to Mod Management",
+                content="""ServMC makes mod management incredibly easy!
 
 You can:
 • Browse thousands of mods from Modrinth
@@ -114,12 +143,12 @@ You can:
 • Support for Forge, Fabric, and Quilt
 
 Let's explore the Mods & Types tab!""",
-                        "action": "switch_to_mods_tab",
-                        "highlight_area": "mods_tab"
-                    },
-                    {
-                        "title": "Understanding Server Types",
-                        "content": """Different server types support different mods:
+                action="switch_to_mods_tab",
+                highlight_area="mods_tab"
+            ),
+            Step(
+                title="Understanding Server Types",
+                content="""Different server types support different mods:
 
 • Vanilla - No mods, official Minecraft only
 • Forge - Popular modding platform, supports .jar mods
@@ -127,12 +156,12 @@ Let's explore the Mods & Types tab!""",
 • Paper/Spigot - High-performance, supports plugins
 
 Check the "Server Types" tab to learn more about each type.""",
-                        "action": "highlight_server_types",
-                        "highlight_area": "server_types_tab"
-                    },
-                    {
-                        "title": "Browsing and Searching Mods",
-                        "content": """The "Browse Mods" tab lets you:
+                action="highlight_server_types",
+                highlight_area="server_types_tab"
+            ),
+            Step(
+                title="Browsing and Searching Mods",
+                content="""The "Browse Mods" tab lets you:
 
 1. Search for mods by name or description
 2. Filter by Minecraft version
@@ -141,12 +170,12 @@ Check the "Server Types" tab to learn more about each type.""",
 5. Install directly to your servers
 
 Try searching for "JEI" (Just Enough Items)!""",
-                        "action": "highlight_mod_browser",
-                        "highlight_area": "mod_browser"
-                    },
-                    {
-                        "title": "Installing Mods",
-                        "content": """To install a mod:
+                action="highlight_mod_browser",
+                highlight_area="mod_browser"
+            ),
+            Step(
+                title="Installing Mods",
+                content="""To install a mod:
 
 1. Search for the mod you want
 2. Select it from the results
@@ -155,12 +184,12 @@ Try searching for "JEI" (Just Enough Items)!""",
 5. ServMC downloads and installs automatically!
 
 The mod will be ready when you restart your server.""",
-                        "action": "highlight_install_button",
-                        "highlight_area": "install_button"
-                    },
-                    {
-                        "title": "Managing Installed Mods",
-                        "content": """The "Installed Mods" tab shows:
+                action="highlight_install_button",
+                highlight_area="install_button"
+            ),
+            Step(
+                title="Managing Installed Mods",
+                content="""The "Installed Mods" tab shows:
 
 • All mods installed on each server
 • Mod file sizes
@@ -168,20 +197,20 @@ The mod will be ready when you restart your server.""",
 • Direct access to the mods folder
 
 Select a server to see its installed mods!""",
-                        "action": "highlight_installed_mods",
-                        "highlight_area": "installed_mods_tab"
-                    }
-                ]
-            },
-            
-            "backup_system": {
-                "title": "📦 Backup & Monitoring System",
-                "description": "Learn about automatic backups and server monitoring",
-                "duration": "6 minutes",
-                "steps": [
-                    {
-                        "title": "Why Backups Matter",
-                        "content": """Backups protect your server data from:
+                action="highlight_installed_mods",
+                highlight_area="installed_mods_tab"
+            )
+        ]
+    },
+
+    "backup_system": {
+        "title": "📦 Backup & Monitoring System",
+        "description": "Learn about automatic backups and server monitoring",
+        "duration": "6 minutes",
+        "steps": [
+            Step(
+                title="Why Backups Matter",
+                content="""Backups protect your server data from:
 
 • Accidental world corruption
 • Server crashes
@@ -189,24 +218,24 @@ Select a server to see its installed mods!""",
 • Hardware failures
 
 ServMC provides automatic backup scheduling and easy restoration!""",
-                        "action": "show_backup_info",
-                        "highlight_area": "main"
-                    },
-                    {
-                        "title": "Creating Manual Backups",
-                        "content": """You can create backups anytime:
+                action="show_backup_info",
+                highlight_area="main"
+            ),
+            Step(
+                title="Creating Manual Backups",
+                content="""You can create backups anytime:
 
 • File → "Backup All Servers" - Backup everything
 • Tools → "Backup Manager" - Advanced options
 • Individual server backups from server panel
 
 Backups are stored safely and can be restored instantly.""",
-                        "action": "highlight_backup_menu",
-                        "highlight_area": "file_menu"
-                    },
-                    {
-                        "title": "Backup Manager",
-                        "content": """The Backup Manager (Tools → Backup Manager) shows:
+                action="highlight_backup_menu",
+                highlight_area="file_menu"
+            ),
+            Step(
+                title="Backup Manager",
+                content="""The Backup Manager (Tools → Backup Manager) shows:
 
 • All available backups
 • Backup dates and sizes
@@ -214,12 +243,12 @@ Backups are stored safely and can be restored instantly.""",
 • Delete old backups
 
 You can restore any server to any backup point!""",
-                        "action": "show_backup_manager",
-                        "highlight_area": "backup_window"
-                    },
-                    {
-                        "title": "Automatic Backup Scheduling",
-                        "content": """ServMC can automatically backup your servers:
+                action="show_backup_manager",
+                highlight_area="backup_window"
+            ),
+            Step(
+                title="Automatic Backup Scheduling",
+                content="""ServMC can automatically backup your servers:
 
 • Daily backups at a set time
 • Weekly backups for long-term storage
@@ -227,12 +256,12 @@ You can restore any server to any backup point!""",
 • Pre-restore safety backups
 
 Configure this in the server settings!""",
-                        "action": "highlight_backup_scheduling",
-                        "highlight_area": "settings"
-                    },
-                    {
-                        "title": "Server Monitoring & Alerts",
-                        "content": """ServMC continuously monitors your servers:
+                action="highlight_backup_scheduling",
+                highlight_area="settings"
+            ),
+            Step(
+                title="Server Monitoring & Alerts",
+                content="""ServMC continuously monitors your servers:
 
 • CPU and memory usage
 • Server uptime tracking
@@ -240,20 +269,20 @@ Configure this in the server settings!""",
 • Discord notifications (optional)
 
 Check Tools → "Server Monitor" for live stats!""",
-                        "action": "show_server_monitor",
-                        "highlight_area": "monitor_window"
-                    }
-                ]
-            },
-            
-            "network_setup": {
-                "title": "🌐 Network Configuration Guide",
-                "description": "Set up port forwarding and external access",
-                "duration": "8 minutes",
-                "steps": [
-                    {
-                        "title": "Network Setup Overview",
-                        "content": """To let friends connect to your server, you need to:
+                action="show_server_monitor",
+                highlight_area="monitor_window"
+            )
+        ]
+    },
+
+    "network_setup": {
+        "title": "🌐 Network Configuration Guide",
+        "description": "Set up port forwarding and external access",
+        "duration": "8 minutes",
+        "steps": [
+            Step(
+                title="Network Setup Overview",
+                content="""To let friends connect to your server, you need to:
 
 1. Configure your router's port forwarding
 2. Set up firewall rules
@@ -261,12 +290,12 @@ Check Tools → "Server Monitor" for live stats!""",
 4. Share your public IP address
 
 ServMC guides you through each step!""",
-                        "action": "switch_to_network_tab",
-                        "highlight_area": "network_tab"
-                    },
-                    {
-                        "title": "Understanding Your Network",
-                        "content": """The Network tab shows:
+                action="switch_to_network_tab",
+                highlight_area="network_tab"
+            ),
+            Step(
+                title="Understanding Your Network",
+                content="""The Network tab shows:
 
 • Your local IP address (internal network)
 • Your public IP address (internet)
@@ -274,12 +303,12 @@ ServMC guides you through each step!""",
 • Router brand detection
 
 This information helps configure port forwarding correctly.""",
-                        "action": "highlight_network_info",
-                        "highlight_area": "network_info"
-                    },
-                    {
-                        "title": "Port Configuration",
-                        "content": """Minecraft servers use specific ports:
+                action="highlight_network_info",
+                highlight_area="network_info"
+            ),
+            Step(
+                title="Port Configuration",
+                content="""Minecraft servers use specific ports:
 
 • Default port: 25565
 • You can change this if needed
@@ -287,12 +316,12 @@ This information helps configure port forwarding correctly.""",
 • ServMC can test if ports are available
 
 The port status shows if it's open or in use.""",
-                        "action": "highlight_port_config",
-                        "highlight_area": "port_config"
-                    },
-                    {
-                        "title": "Router Port Forwarding",
-                        "content": """ServMC provides router-specific guides for:
+                action="highlight_port_config",
+                highlight_area="port_config"
+            ),
+            Step(
+                title="Router Port Forwarding",
+                content="""ServMC provides router-specific guides for:
 
 • TP-Link routers
 • Netgear routers  
@@ -301,44 +330,44 @@ The port status shows if it's open or in use.""",
 • Generic instructions for other brands
 
 Follow the step-by-step guide for your router!""",
-                        "action": "highlight_port_forwarding",
-                        "highlight_area": "port_forwarding_guide"
-                    },
-                    {
-                        "title": "Firewall Configuration",
-                        "content": """Your computer's firewall also needs configuration:
+                action="highlight_port_forwarding",
+                highlight_area="port_forwarding_guide"
+            ),
+            Step(
+                title="Firewall Configuration",
+                content="""Your computer's firewall also needs configuration:
 
 • Windows Firewall instructions
 • Linux UFW/iptables commands
 • macOS firewall setup
 
 ServMC provides OS-specific guides for each platform.""",
-                        "action": "highlight_firewall_config",
-                        "highlight_area": "firewall_config"
-                    },
-                    {
-                        "title": "Testing External Access",
-                        "content": """Use the "Test External Access" button to verify:
+                action="highlight_firewall_config",
+                highlight_area="firewall_config"
+            ),
+            Step(
+                title="Testing External Access",
+                content="""Use the "Test External Access" button to verify:
 
 • Port forwarding is working
 • Server is accessible from internet
 • Friends can connect using your public IP
 
 If the test fails, check your router and firewall settings.""",
-                        "action": "highlight_external_test",
-                        "highlight_area": "external_test"
-                    }
-                ]
-            },
-            
-            "advanced_features": {
-                "title": "⚙️ Advanced Features Tour",
-                "description": "Explore advanced ServMC capabilities",
-                "duration": "10 minutes",
-                "steps": [
-                    {
-                        "title": "Advanced Features Overview",
-                        "content": """ServMC includes many advanced features:
+                action="highlight_external_test",
+                highlight_area="external_test"
+            )
+        ]
+    },
+
+    "advanced_features": {
+        "title": "⚙️ Advanced Features Tour",
+        "description": "Explore advanced ServMC capabilities",
+        "duration": "10 minutes",
+        "steps": [
+            Step(
+                title="Advanced Features Overview",
+                content="""ServMC includes many advanced features:
 
 • Multiple server type support
 • Automatic mod compatibility checking
@@ -348,12 +377,12 @@ If the test fails, check your router and firewall settings.""",
 • Resource monitoring
 
 Let's explore these powerful features!""",
-                        "action": "show_advanced_overview",
-                        "highlight_area": "main"
-                    },
-                    {
-                        "title": "Server Types Deep Dive",
-                        "content": """ServMC supports multiple server types:
+                action="show_advanced_overview",
+                highlight_area="main"
+            ),
+            Step(
+                title="Server Types Deep Dive",
+                content="""ServMC supports multiple server types:
 
 • Vanilla - Official Minecraft
 • Forge - Traditional modding
@@ -363,12 +392,12 @@ Let's explore these powerful features!""",
 • Purpur - Paper with extra features
 
 Each type has different capabilities and performance characteristics.""",
-                        "action": "show_server_types_detail",
-                        "highlight_area": "server_types"
-                    },
-                    {
-                        "title": "Performance Monitoring",
-                        "content": """Real-time server monitoring includes:
+                action="show_server_types_detail",
+                highlight_area="server_types"
+            ),
+            Step(
+                title="Performance Monitoring",
+                content="""Real-time server monitoring includes:
 
 • CPU usage tracking
 • Memory consumption
@@ -377,12 +406,12 @@ Each type has different capabilities and performance characteristics.""",
 • TPS (Ticks Per Second) monitoring
 
 Access detailed stats via Tools → Server Monitor.""",
-                        "action": "show_performance_monitoring",
-                        "highlight_area": "performance"
-                    },
-                    {
-                        "title": "Discord Integration",
-                        "content": """Connect ServMC to Discord for:
+                action="show_performance_monitoring",
+                highlight_area="performance"
+            ),
+            Step(
+                title="Discord Integration",
+                content="""Connect ServMC to Discord for:
 
 • Server start/stop notifications
 • Performance alerts
@@ -390,12 +419,12 @@ Access detailed stats via Tools → Server Monitor.""",
 • Player join/leave notifications
 
 Configure webhook URLs in Settings → Webhooks.""",
-                        "action": "show_discord_integration",
-                        "highlight_area": "discord_settings"
-                    },
-                    {
-                        "title": "Automation Features",
-                        "content": """ServMC can automate many tasks:
+                action="show_discord_integration",
+                highlight_area="discord_settings"
+            ),
+            Step(
+                title="Automation Features",
+                content="""ServMC can automate many tasks:
 
 • Scheduled backups (daily/weekly/hourly)
 • Automatic mod updates
@@ -404,12 +433,12 @@ Configure webhook URLs in Settings → Webhooks.""",
 • Log rotation
 
 Set up automation in server-specific settings.""",
-                        "action": "show_automation",
-                        "highlight_area": "automation"
-                    },
-                    {
-                        "title": "Tips for Best Performance",
-                        "content": """Optimize your servers with these tips:
+                action="show_automation",
+                highlight_area="automation"
+            ),
+            Step(
+                title="Tips for Best Performance",
+                content="""Optimize your servers with these tips:
 
 • Allocate appropriate memory (2-8GB typical)
 • Use Paper/Purpur for better performance
@@ -419,12 +448,25 @@ Set up automation in server-specific settings.""",
 • Use SSD storage when possible
 
 ServMC helps monitor and optimize performance automatically!""",
-                        "action": "show_performance_tips",
-                        "highlight_area": "tips"
-                    }
-                ]
-            }
-        }
+                action="show_performance_tips",
+                highlight_area="tips"
+            )
+        ]
+    }
+}
+
+
+class TutorialManager:
+    """Manages interactive tutorials for ServMC"""
+    
+    def __init__(self, main_window):
+        self.main_window = main_window
+        self.current_tutorial = None
+        self.tutorial_data = self._load_tutorials()
+        
+    def _load_tutorials(self) -> Dict:
+        """Load tutorial definitions"""
+        return TUTORIALS
     
     def show_tutorial_menu(self):
         """Show the tutorial selection menu"""
@@ -439,15 +481,16 @@ ServMC helps monitor and optimize performance automatically!""",
         header_frame.pack(fill=tk.X, padx=20, pady=20)
         
         ttk.Label(header_frame, text="📚 Welcome to ServMC Tutorials!", 
-                 font=("Arial", 16, "bold")).pack()
+                 font=_font(16, "bold")).pack()
         ttk.Label(header_frame, text="Choose a tutorial to get started with ServMC",
-                 font=("Arial", 10)).pack(pady=(5, 0))
+                 font=_font(10)).pack(pady=(5, 0))
         
         # Tutorial list
         tutorials_frame = ttk.LabelFrame(tutorial_window, text="Available Tutorials")
         tutorials_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
         
         # Create tutorial cards
+        description_labels = []
         for tutorial_id, tutorial_data in self.tutorial_data.items():
             card_frame = ttk.Frame(tutorials_frame)
             card_frame.pack(fill=tk.X, padx=10, pady=10)
@@ -457,22 +500,42 @@ ServMC helps monitor and optimize performance automatically!""",
             info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
             
             ttk.Label(info_frame, text=tutorial_data["title"], 
-                     font=("Arial", 12, "bold")).pack(anchor=tk.W)
-            ttk.Label(info_frame, text=tutorial_data["description"],
-                     wraplength=400).pack(anchor=tk.W, pady=(2, 0))
+                     font=_font(12, "bold")).pack(anchor=tk.W)
+            description_label = ttk.Label(info_frame, text=tutorial_data["description"])
+            description_label.pack(anchor=tk.W, pady=(2, 0))
+            description_labels.append(description_label)
             ttk.Label(info_frame, text=f"⏱️ Duration: {tutorial_data['duration']}",
-                     font=("Arial", 9), foreground="gray").pack(anchor=tk.W, pady=(2, 0))
+                     font=_font(9), foreground="gray").pack(anchor=tk.W, pady=(2, 0))
             
             # Start button
             ttk.Button(card_frame, text="Start Tutorial",
-                      command=lambda tid=tutorial_id: self.start_tutorial(tid, tutorial_window)).pack(side=tk.RIGHT, padx=(10, 0))
+                      command=partial(self.start_tutorial, tutorial_id, tutorial_window)).pack(side=tk.RIGHT, padx=(10, 0))
+        
+        # Re-wrap descriptions only when the list width really changes,
+        # debounced so a drag-resize recomputes text metrics once
+        wrap_state = {"width": None, "after_id": None}
+        
+        def apply_wraplength(width):
+            wrap_state["after_id"] = None
+            for label in description_labels:
+                label.configure(wraplength=max(width - 160, 100))
+                
+        def on_tutorials_configure(event):
+            if event.width == wrap_state["width"]:
+                return
+            wrap_state["width"] = event.width
+            if wrap_state["after_id"]:
+                tutorial_window.after_cancel(wrap_state["after_id"])
+            wrap_state["after_id"] = tutorial_window.after(50, apply_wraplength, event.width)
+            
+        tutorials_frame.bind("<Configure>", on_tutorials_configure)
         
         # Footer buttons
         footer_frame = ttk.Frame(tutorial_window)
         footer_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
         
         ttk.Button(footer_frame, text="Quick Start Guide", 
-                  command=lambda: self.show_quick_start(tutorial_window)).pack(side=tk.LEFT)
+                  command=partial(self.show_quick_start, tutorial_window)).pack(side=tk.LEFT)
         ttk.Button(footer_frame, text="Close", 
                   command=tutorial_window.destroy).pack(side=tk.RIGHT)
     
@@ -486,26 +549,19 @@ ServMC helps monitor and optimize performance automatically!""",
             messagebox.showerror("Error", "Tutorial not found!")
             return
         
-        self.current_tutorial = TutorialWindow(self.main_window, tutorial_data)
+        self.current_tutorial = TutorialWindow(self.main_window, tutorial_data, manager=self)
         self.current_tutorial.start()
     
     def show_quick_start(self, parent_window: tk.Toplevel):
         """Show a quick start guide"""
-        parent_window.destroy()
+        if parent_window:
+            parent_window.destroy()
         
         quick_start_window = tk.Toplevel(self.main_window.root)
         quick_start_window.title("🚀 Quick Start Guide")
         quick_start_window.geometry("600x700")
         quick_start_window.transient(self.main_window.root)
         
-        # Scrollable text
-        text_frame = ttk.Frame(quick_start_window)
-        text_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        quick_start_text = tk.Text(text_frame, wrap=tk.WORD, font=("Arial", 10))
-        scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=quick_start_text.yview)
-        quick_start_text.configure(yscrollcommand=scrollbar.set)
-        
         quick_start_content = """🚀 ServMC Quick Start Guide
 
 Welcome to ServMC! Here's how to get started in 5 minutes:
@@ -563,11 +619,9 @@ Welcome to ServMC! Here's how to get started in 5 minutes:
 That's it! You're ready to run amazing Minecraft servers with ServMC! 🎮✨
         """
         
-        quick_start_text.insert(tk.END, quick_start_content)
-        quick_start_text.config(state=tk.DISABLED)
-        
-        quick_start_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Scrollable text
+        _, text_frame = _make_scrolled_text(quick_start_window, quick_start_content, pad=0, font=_font(10))
+        text_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Close button
         ttk.Button(quick_start_window, text="Close", 
@@ -577,12 +631,28 @@ That's it! You're ready to run amazing Minecraft servers with ServMC! 🎮✨
 class TutorialWindow:
     """Individual tutorial window with step-by-step guidance"""
     
-    def __init__(self, main_window, tutorial_data):
+    # Step action name -> handler(self, step); actions without an entry do nothing
+    _ACTION_HANDLERS = {
+        "highlight_main_window": lambda self, step: self.highlight_widget(self.main_window.root),
+        "highlight_tabs": lambda self, step: self.highlight_widget(self.main_window.notebook),
+        "switch_to_mods_tab": lambda self, step: self.switch_to_tab(self.main_window.mods_frame),
+        "switch_to_network_tab": lambda self, step: self.switch_to_tab(self.main_window.network_frame),
+        "highlight_new_server_button": lambda self, step: self.wait_for_new_server(step),
+    }
+    
+    def __init__(self, main_window, tutorial_data, manager=None):
         self.main_window = main_window
         self.tutorial_data = tutorial_data
+        self.manager = manager
+        self._steps = tutorial_data["steps"]
+        self._num_steps = len(self._steps)
         self.current_step = 0
         self.window = None
         self.highlight_overlay = None
+        self._action_binding = None
+        self._pending_highlights = []
+        self._active_highlights = []
+        self._highlight_deadline = None
         
     def start(self):
         """Start the tutorial"""
@@ -597,49 +667,45 @@ class TutorialWindow:
         self.window.transient(self.main_window.root)
         self.window.attributes("-topmost", True)
         
-        # Position window on the right side
-        self.window.geometry("500x400+{}+100".format(
-            self.main_window.root.winfo_x() + self.main_window.root.winfo_width() + 10
-        ))
+        # Position window on the right side; the main window's geometry is
+        # read once here rather than tracked through <Configure> events
+        root = self.main_window.root
+        main_x, main_width = root.winfo_x(), root.winfo_width()
+        self.window.geometry("500x400+{}+100".format(main_x + main_width + 10))
         
         # Header
-        header_frame = ttk.Frame(self.window)
-        header_frame.pack(fill=tk.X, padx=20, pady=(20, 10))
+        self.header_frame = ttk.Frame(self.window)
+        self.header_frame.pack(fill=tk.X, padx=20, pady=(20, 10))
         
-        self.title_label = ttk.Label(header_frame, text="", font=("Arial", 14, "bold"))
+        self.title_label = ttk.Label(self.header_frame, text="", font=_font(14, "bold"))
         self.title_label.pack()
         
-        self.progress_label = ttk.Label(header_frame, text="", font=("Arial", 9), foreground="gray")
+        self.progress_label = ttk.Label(self.header_frame, text="", font=_font(9), foreground="gray")
         self.progress_label.pack(pady=(5, 0))
         
         # Progress bar
-        self.progress_bar = ttk.Progressbar(header_frame, mode="determinate")
+        self.progress_bar = ttk.Progressbar(self.header_frame, mode="determinate")
         self.progress_bar.pack(fill=tk.X, pady=(10, 0))
         
         # Content
-        content_frame = ttk.LabelFrame(self.window, text="Tutorial Step")
-        content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-        
-        self.content_text = tk.Text(content_frame, wrap=tk.WORD, height=10, 
-                                   font=("Arial", 10), state=tk.DISABLED)
-        content_scrollbar = ttk.Scrollbar(content_frame, orient=tk.VERTICAL, 
-                                         command=self.content_text.yview)
-        self.content_text.configure(yscrollcommand=content_scrollbar.set)
+        self.content_frame = ttk.LabelFrame(self.window, text="Tutorial Step")
+        self.content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        self.content_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
-        content_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Step views are built on first visit and swapped in afterwards
+        self._step_views = [None] * self._num_steps
+        self._current_view = None
         
         # Navigation buttons
-        nav_frame = ttk.Frame(self.window)
-        nav_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
+        self.nav_frame = ttk.Frame(self.window)
+        self.nav_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
         
-        self.prev_button = ttk.Button(nav_frame, text="← Previous", command=self.previous_step)
+        self.prev_button = ttk.Button(self.nav_frame, text="← Previous", command=self.previous_step)
         self.prev_button.pack(side=tk.LEFT)
         
-        self.next_button = ttk.Button(nav_frame, text="Next →", command=self.next_step)
+        self.next_button = ttk.Button(self.nav_frame, text="Next →", command=self.next_step)
         self.next_button.pack(side=tk.RIGHT)
         
-        self.skip_button = ttk.Button(nav_frame, text="Skip Tutorial", command=self.close_tutorial)
+        self.skip_button = ttk.Button(self.nav_frame, text="Skip Tutorial", command=self.close_tutorial)
         self.skip_button.pack(side=tk.RIGHT, padx=(0, 10))
         
         # Handle window close
@@ -647,29 +713,26 @@ class TutorialWindow:
         
     def show_current_step(self):
         """Display the current tutorial step"""
-        if self.current_step >= len(self.tutorial_data["steps"]):
+        if self.current_step >= self._num_steps:
             self.finish_tutorial()
             return
             
-        step = self.tutorial_data["steps"][self.current_step]
+        step = self._steps[self.current_step]
         
         # Update UI
-        self.title_label.config(text=step["title"])
-        self.progress_label.config(text=f"Step {self.current_step + 1} of {len(self.tutorial_data['steps'])}")
+        self.title_label.config(text=step.title)
+        self.progress_label.config(text=f"Step {self.current_step + 1} of {self._num_steps}")
         
-        progress_value = ((self.current_step + 1) / len(self.tutorial_data["steps"])) * 100
+        progress_value = ((self.current_step + 1) / self._num_steps) * 100
         self.progress_bar["value"] = progress_value
         
         # Update content
-        self.content_text.config(state=tk.NORMAL)
-        self.content_text.delete(1.0, tk.END)
-        self.content_text.insert(tk.END, step["content"])
-        self.content_text.config(state=tk.DISABLED)
+        self.show_step_view(self.current_step)
         
         # Update navigation buttons
         self.prev_button.config(state=tk.NORMAL if self.current_step > 0 else tk.DISABLED)
         
-        if self.current_step == len(self.tutorial_data["steps"]) - 1:
+        if self.current_step == self._num_steps - 1:
             self.next_button.config(text="Finish", command=self.finish_tutorial)
         else:
             self.next_button.config(text="Next →", command=self.next_step)
@@ -677,44 +740,84 @@ class TutorialWindow:
         # Execute step action
         self.execute_step_action(step)
         
+    def show_step_view(self, index):
+        """Swap in the content view for a step, building it on first visit"""
+        view = self._step_views[index]
+        if view is None:
+            view = self._step_views[index] = self.build_step_view(self._steps[index])
+            
+        if view is not self._current_view:
+            if self._current_view:
+                self._current_view.pack_forget()
+            view.pack(fill=tk.BOTH, expand=True)
+            self._current_view = view
+            
+    def build_step_view(self, step):
+        """Build the read-only content view for a step"""
+        _, view = _make_scrolled_text(self.content_frame, step.content, height=10, font=_font(10))
+        return view
+        
     def execute_step_action(self, step):
         """Execute the action for the current step"""
-        action = step.get("action")
+        action = step.action
         if not action:
             return
             
         # Remove any existing highlights
         self.remove_highlight()
+        self.clear_action_binding()
         
-        if action == "highlight_main_window":
-            self.highlight_widget(self.main_window.root)
-        elif action == "highlight_tabs":
-            self.highlight_widget(self.main_window.notebook)
-        elif action == "switch_to_mods_tab":
-            self.main_window.notebook.select(self.main_window.mods_frame)
-            self.highlight_widget(self.main_window.mods_frame)
-        elif action == "switch_to_network_tab":
-            self.main_window.notebook.select(self.main_window.network_frame)
-            self.highlight_widget(self.main_window.network_frame)
-        elif action == "highlight_new_server_button":
-            # This would highlight the new server button if we can access it
-            pass
-        elif action == "show_backup_manager":
-            # Could trigger showing the backup manager
-            pass
+        handler = self._ACTION_HANDLERS.get(action)
+        if handler:
+            handler(self, step)
+        
+        self.apply_highlights()
+            
+    def switch_to_tab(self, tab_frame):
+        """Select a main window tab and highlight it"""
+        self.main_window.notebook.select(tab_frame)
+        self.highlight_widget(tab_frame)
+        
+    def wait_for_new_server(self, step):
+        """Wait for the user to click the New Server button if the step asks for it"""
+        button = getattr(self.main_window.server_panel, "new_server_button", None)
+        if button and step.wait_for_action:
+            self.wait_for_click(button)
             
     def highlight_widget(self, widget):
-        """Highlight a specific widget"""
-        try:
-            # Create a simple highlight effect by changing background color temporarily
-            original_bg = widget.cget("bg")
-            widget.config(bg="#ffff99")  # Light yellow highlight
+        """Queue a widget to be highlighted when the step's actions are applied"""
+        self._pending_highlights.append(widget)
+        
+    def apply_highlights(self):
+        """Highlight all queued widgets with a single redraw pass"""
+        if not self._pending_highlights:
+            return
             
-            # Remove highlight after 3 seconds
-            self.window.after(3000, lambda: self.restore_widget_bg(widget, original_bg))
-        except Exception:
-            # Some widgets don't support background color changes
-            pass
+        highlighted = []
+        for widget in self._pending_highlights:
+            try:
+                # Create a simple highlight effect by changing background color temporarily
+                original_bg = widget.cget("bg")
+                widget.config(bg="#ffff99")  # Light yellow highlight
+                highlighted.append((widget, original_bg))
+            except Exception:
+                # Some widgets don't support background color changes
+                pass
+        self._pending_highlights = []
+        
+        if highlighted:
+            self.window.update_idletasks()
+            self._active_highlights.extend(highlighted)
+            # Remove all highlights after 3 seconds with one shared timer
+            if self._highlight_deadline is None:
+                self._highlight_deadline = self.window.after(3000, self.restore_all_highlights)
+            
+    def restore_all_highlights(self):
+        """Restore the original background of every highlighted widget"""
+        self._highlight_deadline = None
+        for widget, original_bg in self._active_highlights:
+            self.restore_widget_bg(widget, original_bg)
+        self._active_highlights = []
             
     def restore_widget_bg(self, widget, original_bg):
         """Restore widget's original background"""
@@ -723,10 +826,31 @@ class TutorialWindow:
         except Exception:
             pass
             
+    def wait_for_click(self, widget):
+        """Advance to the next step once the user clicks the given widget"""
+        funcid = widget.bind("<Button-1>", self.on_action_performed, add="+")
+        self._action_binding = (widget, funcid)
+        
+    def on_action_performed(self, event=None):
+        """Handle the action a step was waiting for"""
+        self.clear_action_binding()
+        self.next_step()
+        
+    def clear_action_binding(self):
+        """Stop waiting for a user action"""
+        if self._action_binding:
+            widget, funcid = self._action_binding
+            self._action_binding = None
+            try:
+                widget.unbind("<Button-1>", funcid)
+            except tk.TclError:
+                pass
+            
     def remove_highlight(self):
         """Remove any existing highlights"""
-        # This would be expanded to remove overlay highlights
-        pass
+        if self._highlight_deadline is not None:
+            self.window.after_cancel(self._highlight_deadline)
+        self.restore_all_highlights()
         
     def next_step(self):
         """Go to the next tutorial step"""
@@ -742,55 +866,46 @@ class TutorialWindow:
     def finish_tutorial(self):
         """Finish the tutorial"""
         self.remove_highlight()
+        self.clear_action_binding()
         
-        # Show completion message
-        completion_window = tk.Toplevel(self.window)
-        completion_window.title("🎉 Tutorial Complete!")
-        completion_window.geometry("400x300")
-        completion_window.transient(self.window)
-        completion_window.grab_set()
+        # Swap the step view for the completion message in place
+        for frame in (self.header_frame, self.content_frame, self.nav_frame):
+            frame.pack_forget()
+        self.window.title("🎉 Tutorial Complete!")
         
-        # Center the completion window
-        completion_window.update_idletasks()
-        x = (completion_window.winfo_screenwidth() // 2) - (400 // 2)
-        y = (completion_window.winfo_screenheight() // 2) - (300 // 2)
-        completion_window.geometry(f"400x300+{x}+{y}")
+        completion_frame = ttk.Frame(self.window)
+        completion_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Success content
-        ttk.Label(completion_window, text="🎉 Tutorial Complete!", 
-                 font=("Arial", 16, "bold")).pack(pady=20)
+        ttk.Label(completion_frame, text="🎉 Tutorial Complete!", 
+                 font=_font(16, "bold")).pack(pady=20)
         
-        ttk.Label(completion_window, text=f"You've completed:\n{self.tutorial_data['title']}",
-                 font=("Arial", 12), justify=tk.CENTER).pack(pady=10)
+        ttk.Label(completion_frame, text=f"You've completed:\n{self.tutorial_data['title']}",
+                 font=_font(12), justify=tk.CENTER).pack(pady=10)
         
-        ttk.Label(completion_window, text="You're now ready to use this feature of ServMC!",
+        ttk.Label(completion_frame, text="You're now ready to use this feature of ServMC!",
                  wraplength=350, justify=tk.CENTER).pack(pady=20)
         
         # Action buttons
-        button_frame = ttk.Frame(completion_window)
+        button_frame = ttk.Frame(completion_frame)
         button_frame.pack(pady=20)
         
         ttk.Button(button_frame, text="Start Another Tutorial", 
-                  command=lambda: self.start_another_tutorial(completion_window)).pack(side=tk.LEFT, padx=5)
+                  command=self.start_another_tutorial).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Close", 
-                  command=lambda: self.close_completion(completion_window)).pack(side=tk.LEFT, padx=5)
+                  command=self.close_tutorial).pack(side=tk.LEFT, padx=5)
         
-    def start_another_tutorial(self, completion_window):
+    def start_another_tutorial(self):
         """Start another tutorial"""
-        completion_window.destroy()
         self.close_tutorial()
-        # Show tutorial menu again
-        tutorial_manager = TutorialManager(self.main_window)
+        # Show tutorial menu again, reusing the manager that started us
+        tutorial_manager = self.manager or TutorialManager(self.main_window)
         tutorial_manager.show_tutorial_menu()
         
-    def close_completion(self, completion_window):
-        """Close completion window and tutorial"""
-        completion_window.destroy()
-        self.close_tutorial()
-        
     def close_tutorial(self):
         """Close the tutorial"""
         self.remove_highlight()
+        self.clear_action_binding()
         if self.window:
             self.window.destroy()
 
@@ -798,29 +913,24 @@ class TutorialWindow:
 class InteractiveTour:
     """Interactive tour system for first-time users"""
     
-    def __init__(self, main_window):
+    def __init__(self, main_window, get_tutorial_manager: Optional[Callable] = None):
         self.main_window = main_window
+        self.get_tutorial_manager = get_tutorial_manager or (lambda: TutorialManager(main_window))
         
     def start_first_time_tour(self):
         """Start the first-time user tour"""
+        # Build hidden and map once at its final position
         welcome_window = tk.Toplevel(self.main_window.root)
+        welcome_window.withdraw()
         welcome_window.title("🎉 Welcome to ServMC!")
-        welcome_window.geometry("500x400")
         welcome_window.transient(self.main_window.root)
-        welcome_window.grab_set()
-        
-        # Center window
-        welcome_window.update_idletasks()
-        x = (welcome_window.winfo_screenwidth() // 2) - (500 // 2)
-        y = (welcome_window.winfo_screenheight() // 2) - (400 // 2)
-        welcome_window.geometry(f"500x400+{x}+{y}")
         
         # Welcome content
         ttk.Label(welcome_window, text="🎉 Welcome to ServMC!", 
-                 font=("Arial", 18, "bold")).pack(pady=20)
+                 font=_font(18, "bold")).pack(pady=20)
                  
         ttk.Label(welcome_window, text="Your Complete Minecraft Server Management Solution",
-                 font=("Arial", 12)).pack(pady=5)
+                 font=_font(12)).pack(pady=5)
         
         welcome_text = """ServMC makes it easy to:
 
@@ -833,41 +943,69 @@ class InteractiveTour:
 
 Would you like to take a quick tour to get started?"""
         
-        ttk.Label(welcome_window, text=welcome_text, wraplength=450, 
-                 justify=tk.CENTER, font=("Arial", 10)).pack(pady=20)
+        # A fixed-size read-only Text lays the text out once instead of
+        # re-wrapping a Label on every geometry change
+        welcome_body = tk.Text(welcome_window, width=55, height=10, wrap=tk.WORD, bd=0,
+                               highlightthickness=0, bg=welcome_window.cget("bg"),
+                               font=_font(10))
+        welcome_body.insert("1.0", welcome_text)
+        welcome_body.tag_configure("center", justify=tk.CENTER)
+        welcome_body.tag_add("center", "1.0", tk.END)
+        welcome_body.configure(state=tk.DISABLED)
+        welcome_body.pack(pady=20)
         
         # Tour options
         button_frame = ttk.Frame(welcome_window)
         button_frame.pack(pady=30)
         
         ttk.Button(button_frame, text="🚀 Start Interactive Tour", 
-                  command=lambda: self.start_guided_tour(welcome_window)).pack(pady=5)
+                  command=partial(self.start_guided_tour, welcome_window)).pack(pady=5)
         ttk.Button(button_frame, text="📚 Browse Tutorials", 
-                  command=lambda: self.show_tutorials(welcome_window)).pack(pady=5)
+                  command=partial(self.show_tutorials, welcome_window)).pack(pady=5)
         ttk.Button(button_frame, text="⚡ Jump Right In", 
                   command=welcome_window.destroy).pack(pady=5)
         
+        # Center window
+        welcome_window.update_idletasks()
+        x = (welcome_window.winfo_screenwidth() // 2) - (500 // 2)
+        y = (welcome_window.winfo_screenheight() // 2) - (400 // 2)
+        welcome_window.geometry(f"500x400+{x}+{y}")
+        welcome_window.deiconify()
+        welcome_window.grab_set()
+        
     def start_guided_tour(self, welcome_window):
         """Start the guided tour"""
         welcome_window.destroy()
-        tutorial_manager = TutorialManager(self.main_window)
-        tutorial_manager.start_tutorial("getting_started")
+        self.get_tutorial_manager().start_tutorial("getting_started")
         
     def show_tutorials(self, welcome_window):
         """Show tutorial menu"""
         welcome_window.destroy()
-        tutorial_manager = TutorialManager(self.main_window)
-        tutorial_manager.show_tutorial_menu()
+        self.get_tutorial_manager().show_tutorial_menu()
 
 
 def create_tutorial_help_system(main_window):
-    """Create and return tutorial help system components"""
-    tutorial_manager = TutorialManager(main_window)
-    interactive_tour = InteractiveTour(main_window)
+    """Create and return tutorial help system components
+    
+    The TutorialManager and InteractiveTour are only constructed the first
+    time one of the returned callables is used.
+    """
+    components = {}
+    
+    def get_tutorial_manager():
+        if "tutorial_manager" not in components:
+            components["tutorial_manager"] = TutorialManager(main_window)
+        return components["tutorial_manager"]
+    
+    def get_interactive_tour():
+        if "interactive_tour" not in components:
+            components["interactive_tour"] = InteractiveTour(main_window, get_tutorial_manager)
+        return components["interactive_tour"]
     
     return {
-        "tutorial_manager": tutorial_manager,
-        "interactive_tour": interactive_tour,
-        "show_tutorials": tutorial_manager.show_tutorial_menu,
-        "start_first_time_tour": interactive_tour.start_first_time_tour
-    } 
\ No newline at end of file
+        "get_tutorial_manager": get_tutorial_manager,
+        "start_tutorial": lambda tutorial_id: get_tutorial_manager().start_tutorial(tutorial_id),
+        "show_tutorials": lambda: get_tutorial_manager().show_tutorial_menu(),
+        "show_quick_start": lambda: get_tutorial_manager().show_quick_start(None),
+        "start_first_time_tour": lambda: get_interactive_tour().start_first_time_tour()
+    }
@@ -3,165 +3,370 @@ Tutorial Overlay System for ServMC
 Provides visual highlighting and tooltips for UI elements during tutorials
 """
 
+import heapq
 import tkinter as tk
-from tkinter import ttk
 import time
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Optional
 
 
+def _widget_bounds(widget) -> Tuple[int, int, int, int]:
+    """Return a widget's (root x, root y, width, height) in one Tcl evaluation"""
+    path = widget._w
+    bounds = widget.tk.eval(f"list [winfo rootx {path}] [winfo rooty {path}] "
+                            f"[winfo width {path}] [winfo height {path}]")
+    return tuple(int(value) for value in widget.tk.splitlist(bounds))
+
+
+def _new_overlay(master, bg: str, size: Optional[str] = None, alpha: Optional[float] = None):
+    """Create a hidden, undecorated, always-on-top overlay Toplevel.
+    
+    All window-manager setup is issued as one Tcl script rather than one
+    call per attribute.
+    """
+    overlay = tk.Toplevel(master, bg=bg)
+    path = overlay._w
+    script = (f"wm withdraw {path}; wm title {path} {{}}; "
+              f"wm overrideredirect {path} 1; wm attributes {path} -topmost 1")
+    if alpha is not None:
+        script += f" -alpha {alpha}"
+    if size is not None:
+        script += f"; wm geometry {path} {size}"
+    overlay.tk.eval(script)
+    return overlay
+
+
+def _move(overlay, x: int, y: int):
+    """Move an overlay whose size was fixed when it was built"""
+    overlay.tk.call("wm", "geometry", overlay._w, f"+{int(x)}+{int(y)}")
+
+
+# Highlight overlay position -> (arrow glyph, x, y) inside the 250x100 overlay
+_HIGHLIGHT_ARROWS = {
+    "right": ("◀", 5, 40),
+    "left": ("▶", 225, 40),
+    "top": ("▼", 115, 72),
+    "bottom": ("▲", 115, 2),
+}
+
+
 class TutorialOverlay:
     """Visual overlay system for highlighting UI elements during tutorials"""
     
     def __init__(self, root_window):
         self.root = root_window
-        self.overlays = []
-        self.tooltips = []
+        self.overlays = {}  # id -> pooled overlay currently shown
+        self.tooltips = {}  # id -> pooled tooltip currently shown
         self.highlights = []
         
+        # One reusable Toplevel per overlay kind, built on first use and
+        # withdrawn/deiconified instead of destroyed and rebuilt
+        self._pool = {}
+        self._inline_parts = None  # border strips + label for in-window highlights
+        self._bg_supported = {}  # widget class -> supports "bg"
+        self._hl_state = {}  # highlighted widget -> (original bg, restore after id)
+        
+        # Auto-hide deadlines are kept in a min-heap served by a single
+        # reaper after() job instead of one timer per overlay. Entries whose
+        # deadline no longer matches self._deadlines are stale and skipped.
+        self._expiry_heap = []
+        self._deadlines = {}  # id(overlay) -> (deadline, overlay, on_hide)
+        self._reaper_id = None
+        self._reaper_deadline = None
+        
+        # Screen size is queried once and re-read only after the root
+        # window has been reconfigured (e.g. moved to another monitor)
+        self._screen_size = None
+        self.root.bind("<Configure>", self._on_root_configure, add="+")
+        
+        # Set once the root window is being destroyed; late after() callbacks
+        # then skip building overlays on a dying interpreter
+        self._alive = True
+        self.root.bind("<Destroy>", self._on_root_destroy, add="+")
+    
+    def _on_root_destroy(self, event):
+        """Stop creating overlays once the root window goes away"""
+        if event.widget is self.root:
+            self._alive = False
+            if self._reaper_id is not None:
+                self.root.after_cancel(self._reaper_id)
+                self._reaper_id = None
+    
+    def _on_root_configure(self, event):
+        """Invalidate the cached screen size when the root window changes"""
+        if event.widget is self.root:
+            self._screen_size = None
+    
+    def _get_screen_size(self) -> Tuple[int, int]:
+        """Return the cached (width, height) of the screen"""
+        if self._screen_size is None:
+            self._screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+        return self._screen_size
+    
+    def _get_overlay(self, kind: str, build):
+        """Return the pooled overlay for a kind, building it on first use"""
+        overlay = self._pool.get(kind)
+        if overlay is None or not overlay.winfo_exists():
+            overlay = build()
+            self._pool[kind] = overlay
+        return overlay
+    
+    def _show(self, overlay, shown: Dict, duration: Optional[int] = None, on_hide=None):
+        """Show a pooled overlay, optionally hiding it again after duration ms"""
+        self._cancel_hide(overlay)
+        shown[id(overlay)] = overlay
+        # Settle all pending geometry/style changes, then map once
+        overlay.update_idletasks()
+        overlay.deiconify()
+        overlay.lift()
+        
+        if duration:
+            self._schedule_hide(overlay, duration, on_hide or self.remove_overlay)
+    
+    def _schedule_hide(self, overlay, duration: int, on_hide):
+        """Hide an overlay via on_hide(overlay) after duration ms"""
+        deadline = time.monotonic() + duration / 1000
+        self._deadlines[id(overlay)] = (deadline, overlay, on_hide)
+        heapq.heappush(self._expiry_heap, (deadline, id(overlay)))
+        self._arm_reaper()
+    
+    def _cancel_hide(self, overlay):
+        """Cancel a pending auto-hide for an overlay"""
+        self._deadlines.pop(id(overlay), None)
+    
+    def _is_stale(self, entry) -> bool:
+        """Whether a heap entry was cancelled or superseded"""
+        deadline, overlay_id = entry
+        current = self._deadlines.get(overlay_id)
+        return current is None or current[0] != deadline
+    
+    def _arm_reaper(self):
+        """Make sure the reaper runs at the earliest pending deadline"""
+        heap = self._expiry_heap
+        while heap and self._is_stale(heap[0]):
+            heapq.heappop(heap)
+        if not heap:
+            return
+        
+        next_deadline = heap[0][0]
+        if self._reaper_id is not None:
+            if self._reaper_deadline <= next_deadline:
+                return
+            self.root.after_cancel(self._reaper_id)
+        
+        delay = max(0, int((next_deadline - time.monotonic()) * 1000))
+        self._reaper_deadline = next_deadline
+        self._reaper_id = self.root.after(delay, self._reap)
+    
+    def _reap(self):
+        """Hide every overlay whose deadline has passed, then re-arm"""
+        self._reaper_id = None
+        now = time.monotonic()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if self._is_stale(entry):
+                continue
+            _, overlay, on_hide = self._deadlines.pop(entry[1])
+            on_hide(overlay)
+        self._arm_reaper()
+    
+    def _build_highlight_overlay(self):
+        """Build the hidden Toplevel reused by create_highlight_overlay"""
+        overlay = _new_overlay(self.root, "#2c3e50", "250x100", alpha=0.8)
+        
+        # Message
+        overlay._msg_label = tk.Label(overlay, bg="#2c3e50", fg="white",
+                                      font=("Arial", 10), 
+                                      wraplength=230,
+                                      justify=tk.LEFT)
+        overlay._msg_label.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+        
+        # Arrows pointing to the target, one per overlay position, built
+        # once and placed or hidden on each use
+        overlay._arrows = {}
+        for position, (glyph, x, y) in _HIGHLIGHT_ARROWS.items():
+            arrow = tk.Label(overlay, text=glyph, 
+                             bg="#2c3e50", fg="#3498db",
+                             font=("Arial", 16))
+            overlay._arrows[position] = (arrow, x, y)
+        return overlay
+    
+    def _build_inline_highlight(self):
+        """Build the border strips and message label used for in-window highlights"""
+        parts = {side: tk.Frame(self.root, bg="#3498db") for side in ("top", "bottom", "left", "right")}
+        parts["message"] = tk.Label(self.root, bg="#2c3e50", fg="white",
+                                    font=("Arial", 10),
+                                    wraplength=230,
+                                    justify=tk.LEFT,
+                                    padx=10, pady=10)
+        return parts
+    
+    def _show_inline_highlight(self, x: int, y: int, width: int, height: int,
+                               message: str, position: str):
+        """Outline a widget of the root window and place the message beside it.
+        
+        Returns the parts dict, which remove_overlay accepts like any other
+        overlay, or None when the message would not fit inside the root
+        window and a floating overlay is needed instead.
+        """
+        root_x, root_y, root_width, root_height = _widget_bounds(self.root)
+        x -= root_x
+        y -= root_y
+        
+        if position == "right":
+            msg_x, msg_y = x + width + 10, y
+        elif position == "left":
+            msg_x, msg_y = x - 260, y
+        elif position == "top":
+            msg_x, msg_y = x, y - 110
+        else:  # bottom
+            msg_x, msg_y = x, y + height + 10
+        if msg_x < 0 or msg_y < 0 or msg_x + 250 > root_width or msg_y + 100 > root_height:
+            return None
+        
+        if self._inline_parts is None:
+            self._inline_parts = self._build_inline_highlight()
+        parts = self._inline_parts
+        
+        border = 3
+        parts["top"].place(x=x - border, y=y - border, width=width + 2 * border, height=border)
+        parts["bottom"].place(x=x - border, y=y + height, width=width + 2 * border, height=border)
+        parts["left"].place(x=x - border, y=y, width=border, height=height)
+        parts["right"].place(x=x + width, y=y, width=border, height=height)
+        parts["message"].configure(text=message)
+        parts["message"].place(x=msg_x, y=msg_y, width=250, height=100)
+        for part in parts.values():
+            part.lift()
+        
+        # Auto-hide after 5 seconds
+        self.overlays[id(parts)] = parts
+        self._schedule_hide(parts, 5000, self._hide_inline_highlight)
+        return parts
+    
+    def _hide_inline_highlight(self, parts):
+        """Remove the in-window highlight"""
+        self._cancel_hide(parts)
+        self.overlays.pop(id(parts), None)
+        for part in parts.values():
+            if part.winfo_exists():
+                part.place_forget()
+    
     def create_highlight_overlay(self, target_widget, message: str, position: str = "right"):
         """Create a highlight overlay on a specific widget"""
-        try:
-            # Get widget position and size
-            x = target_widget.winfo_rootx()
-            y = target_widget.winfo_rooty()
-            width = target_widget.winfo_width()
-            height = target_widget.winfo_height()
-            
-            # Create overlay window
-            overlay = tk.Toplevel(self.root)
-            overlay.title("")
-            overlay.attributes("-topmost", True)
-            overlay.attributes("-alpha", 0.8)
-            overlay.overrideredirect(True)  # Remove window decorations
-            
-            # Position overlay around the target widget
-            if position == "right":
-                overlay.geometry(f"250x100+{x + width + 10}+{y}")
-            elif position == "left":
-                overlay.geometry(f"250x100+{x - 260}+{y}")
-            elif position == "top":
-                overlay.geometry(f"250x100+{x}+{y - 110}")
-            else:  # bottom
-                overlay.geometry(f"250x100+{x}+{y + height + 10}")
-            
-            # Style the overlay
-            overlay.configure(bg="#2c3e50")
-            
-            # Add message
-            msg_label = tk.Label(overlay, text=message, 
-                               bg="#2c3e50", fg="white",
-                               font=("Arial", 10), 
-                               wraplength=230,
-                               justify=tk.LEFT)
-            msg_label.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
-            
-            # Add arrow pointing to target (simple version)
-            if position == "right":
-                arrow_label = tk.Label(overlay, text="◀", 
-                                     bg="#2c3e50", fg="#3498db",
-                                     font=("Arial", 16))
-                arrow_label.place(x=5, y=40)
-            
-            # Store overlay for cleanup
-            self.overlays.append(overlay)
-            
-            # Auto-hide after 5 seconds
-            self.root.after(5000, lambda: self.remove_overlay(overlay))
-            
-            return overlay
-            
-        except Exception as e:
-            print(f"Failed to create highlight overlay: {e}")
+        if not self._alive or not target_widget.winfo_exists():
             return None
+        
+        # Get widget position and size
+        x, y, width, height = _widget_bounds(target_widget)
+        
+        # Inside our own window, draw the highlight in place without a Toplevel
+        if target_widget.winfo_toplevel() is self.root:
+            inline = self._show_inline_highlight(x, y, width, height, message, position)
+            if inline is not None:
+                return inline
+        
+        overlay = self._get_overlay("highlight", self._build_highlight_overlay)
+        
+        # Position overlay around the target widget
+        if position == "right":
+            _move(overlay, x + width + 10, y)
+        elif position == "left":
+            _move(overlay, x - 260, y)
+        elif position == "top":
+            _move(overlay, x, y - 110)
+        else:  # bottom
+            _move(overlay, x, y + height + 10)
+        
+        overlay._msg_label.configure(text=message)
+        for arrow_position, (arrow, arrow_x, arrow_y) in overlay._arrows.items():
+            if arrow_position == position:
+                arrow.place(x=arrow_x, y=arrow_y)
+            else:
+                arrow.place_forget()
+        
+        # Auto-hide after 5 seconds
+        self._show(overlay, self.overlays, 5000)
+        
+        return overlay
+    
+    def _build_tooltip(self):
+        """Build the hidden Toplevel reused by create_tooltip"""
+        tooltip = _new_overlay(self.root, "#34495e")
+        
+        tooltip._label = tk.Label(tooltip, bg="#34495e", fg="white",
+                                  font=("Arial", 9),
+                                  padx=8, pady=4)
+        tooltip._label.pack()
+        return tooltip
     
     def create_tooltip(self, target_widget, text: str, duration: int = 3000):
         """Create a temporary tooltip for a widget"""
-        try:
-            # Get widget position
-            x = target_widget.winfo_rootx()
-            y = target_widget.winfo_rooty()
-            height = target_widget.winfo_height()
-            
-            # Create tooltip window
-            tooltip = tk.Toplevel(self.root)
-            tooltip.title("")
-            tooltip.attributes("-topmost", True)
-            tooltip.overrideredirect(True)
-            
-            # Position below the widget
-            tooltip.geometry(f"+{x}+{y + height + 5}")
-            
-            # Style tooltip
-            tooltip.configure(bg="#34495e")
-            
-            tooltip_label = tk.Label(tooltip, text=text,
-                                   bg="#34495e", fg="white",
-                                   font=("Arial", 9),
-                                   padx=8, pady=4)
-            tooltip_label.pack()
-            
-            # Store for cleanup
-            self.tooltips.append(tooltip)
-            
-            # Auto-remove after duration
-            self.root.after(duration, lambda: self.remove_tooltip(tooltip))
-            
-            return tooltip
-            
-        except Exception:
+        if not self._alive or not target_widget.winfo_exists():
             return None
+        
+        # Get widget position
+        x, y, _, height = _widget_bounds(target_widget)
+        
+        tooltip = self._get_overlay("tooltip", self._build_tooltip)
+        
+        # Position below the widget
+        _move(tooltip, x, y + height + 5)
+        tooltip._label.configure(text=text)
+        
+        # Auto-remove after duration
+        self._show(tooltip, self.tooltips, duration, self.remove_tooltip)
+        
+        return tooltip
     
     def highlight_widget(self, widget, color: str = "#f39c12", duration: int = 3000):
         """Temporarily highlight a widget by changing its background"""
-        try:
-            # Store original background
-            original_bg = widget.cget("bg")
-            
-            # Change to highlight color
-            widget.configure(bg=color)
-            
-            # Restore original color after duration
-            def restore_bg():
-                try:
-                    widget.configure(bg=original_bg)
-                except Exception:
-                    pass
-            
-            self.root.after(duration, restore_bg)
-            
-        except Exception:
-            # Widget doesn't support background color changes
-            pass
-    
-    def create_step_indicator(self, current_step: int, total_steps: int, 
-                            title: str = "", position: Tuple[int, int] = None):
-        """Create a step indicator overlay"""
-        indicator = tk.Toplevel(self.root)
-        indicator.title("")
-        indicator.attributes("-topmost", True)
-        indicator.overrideredirect(True)
+        if not self._alive or not widget.winfo_exists():
+            return
         
-        # Position in top-right corner if not specified
-        if position is None:
-            screen_width = self.root.winfo_screenwidth()
-            position = (screen_width - 220, 20)
+        # Already highlighted: keep the real original color and re-arm its restore
+        state = self._hl_state.get(widget)
+        if state is not None:
+            original_bg, after_id = state
+            self.root.after_cancel(after_id)
+        else:
+            # Probe background support once per widget class (ttk widgets have none)
+            widget_type = type(widget)
+            if self._bg_supported.get(widget_type) is False:
+                return
+            try:
+                # Store original background
+                original_bg = widget.cget("bg")
+            except tk.TclError:
+                self._bg_supported[widget_type] = False
+                return
+            self._bg_supported[widget_type] = True
         
-        indicator.geometry(f"200x80+{position[0]}+{position[1]}")
-        indicator.configure(bg="#3498db")
+        # Change to highlight color
+        widget.configure(bg=color)
         
-        # Title
-        if title:
-            title_label = tk.Label(indicator, text=title, 
-                                 bg="#3498db", fg="white",
-                                 font=("Arial", 10, "bold"))
-            title_label.pack(pady=5)
+        # Restore original color after duration
+        after_id = self.root.after(duration, self._restore_highlight, widget)
+        self._hl_state[widget] = (original_bg, after_id)
+    
+    def _restore_highlight(self, widget):
+        """Restore a highlighted widget's original background"""
+        original_bg, _ = self._hl_state.pop(widget)
+        if widget.winfo_exists():
+            widget.configure(bg=original_bg)
+    
+    def _build_step_indicator(self):
+        """Build the hidden Toplevel reused by create_step_indicator"""
+        indicator = _new_overlay(self.root, "#3498db", "200x80")
+        
+        # Title, packed only when the caller gives one
+        indicator._title_label = tk.Label(indicator, bg="#3498db", fg="white",
+                                          font=("Arial", 10, "bold"))
         
         # Progress
-        progress_text = f"Step {current_step} of {total_steps}"
-        progress_label = tk.Label(indicator, text=progress_text,
-                                bg="#3498db", fg="white",
-                                font=("Arial", 9))
-        progress_label.pack()
+        indicator._progress_label = tk.Label(indicator, bg="#3498db", fg="white",
+                                             font=("Arial", 9))
+        indicator._progress_label.pack()
         
         # Progress bar
         progress_frame = tk.Frame(indicator, bg="#3498db")
@@ -170,42 +375,55 @@ class TutorialOverlay:
         progress_bg = tk.Frame(progress_frame, height=4, bg="#2980b9")
         progress_bg.pack(fill=tk.X)
         
-        progress_fill_width = int((current_step / total_steps) * 180)
-        progress_fill = tk.Frame(progress_frame, height=4, bg="white", width=progress_fill_width)
-        progress_fill.place(x=0, y=0)
-        
-        self.overlays.append(indicator)
+        indicator._progress_fill = tk.Frame(progress_frame, height=4, bg="white", width=0)
+        indicator._progress_fill.place(x=0, y=0)
         return indicator
     
-    def create_welcome_bubble(self, text: str, position: Tuple[int, int] = None):
-        """Create a welcome speech bubble"""
-        bubble = tk.Toplevel(self.root)
-        bubble.title("")
-        bubble.attributes("-topmost", True)
-        bubble.overrideredirect(True)
+    def create_step_indicator(self, current_step: int, total_steps: int, 
+                            title: str = "", position: Tuple[int, int] = None):
+        """Create a step indicator overlay"""
+        if not self._alive:
+            return None
         
-        # Center on screen if no position given
+        indicator = self._get_overlay("step", self._build_step_indicator)
+        
+        # Position in top-right corner if not specified
         if position is None:
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
-            position = (screen_width // 2 - 200, screen_height // 2 - 100)
+            screen_width, _ = self._get_screen_size()
+            position = (screen_width - 220, 20)
+        
+        _move(indicator, position[0], position[1])
         
-        bubble.geometry(f"400x200+{position[0]}+{position[1]}")
-        bubble.configure(bg="#e74c3c")
+        # Title
+        if title:
+            indicator._title_label.configure(text=title)
+            indicator._title_label.pack(pady=5, before=indicator._progress_label)
+        else:
+            indicator._title_label.pack_forget()
         
-        # Welcome icon
-        icon_label = tk.Label(bubble, text="🎉", 
-                            bg="#e74c3c", fg="white",
-                            font=("Arial", 24))
-        icon_label.pack(pady=10)
+        # Progress
+        indicator._progress_label.configure(text=f"Step {current_step} of {total_steps}")
+        indicator._progress_fill.configure(width=int((current_step / total_steps) * 180))
+        
+        self._show(indicator, self.overlays)
+        return indicator
+    
+    def _build_welcome_bubble(self):
+        """Build the hidden Toplevel reused by create_welcome_bubble"""
+        bubble = _new_overlay(self.root, "#e74c3c", "400x200")
+        
+        # Welcome icon, rendered once for the pooled bubble
+        bubble._icon = tk.Label(bubble, text="🎉", 
+                                bg="#e74c3c", fg="white",
+                                font=("Arial", 24))
+        bubble._icon.pack(pady=10)
         
         # Welcome text
-        text_label = tk.Label(bubble, text=text,
-                            bg="#e74c3c", fg="white",
-                            font=("Arial", 12),
-                            wraplength=360,
-                            justify=tk.CENTER)
-        text_label.pack(padx=20, pady=10)
+        bubble._text_label = tk.Label(bubble, bg="#e74c3c", fg="white",
+                                      font=("Arial", 12),
+                                      wraplength=360,
+                                      justify=tk.CENTER)
+        bubble._text_label.pack(padx=20, pady=10)
         
         # Close button
         close_btn = tk.Button(bubble, text="Continue",
@@ -213,179 +431,217 @@ class TutorialOverlay:
                             bg="white", fg="#e74c3c",
                             font=("Arial", 10, "bold"))
         close_btn.pack(pady=10)
+        return bubble
+    
+    def create_welcome_bubble(self, text: str, position: Tuple[int, int] = None):
+        """Create a welcome speech bubble"""
+        if not self._alive:
+            return None
         
-        self.overlays.append(bubble)
+        bubble = self._get_overlay("bubble", self._build_welcome_bubble)
+        
+        # Center on screen if no position given
+        if position is None:
+            screen_width, screen_height = self._get_screen_size()
+            position = (screen_width // 2 - 200, screen_height // 2 - 100)
+        
+        _move(bubble, position[0], position[1])
+        bubble._text_label.configure(text=text)
+        
+        self._show(bubble, self.overlays)
         return bubble
     
+    def _build_feature_callout(self):
+        """Build the hidden Toplevel reused by create_feature_callout"""
+        callout = _new_overlay(self.root, "#27ae60", "280x120")
+        
+        # Feature name
+        callout._name_label = tk.Label(callout, bg="#27ae60", fg="white",
+                                       font=("Arial", 12, "bold"))
+        callout._name_label.pack(pady=5)
+        
+        # Description
+        callout._desc_label = tk.Label(callout, bg="#27ae60", fg="white",
+                                       font=("Arial", 9),
+                                       wraplength=260,
+                                       justify=tk.CENTER)
+        callout._desc_label.pack(padx=10, pady=5)
+        
+        # Action button
+        callout._action_btn = tk.Button(callout, command=lambda: self.remove_overlay(callout),
+                                        bg="white", fg="#27ae60",
+                                        font=("Arial", 9, "bold"))
+        callout._action_btn.pack(pady=5)
+        
+        # Add arrow pointing to target, rendered once for the pooled callout
+        callout._arrow = tk.Label(callout, text="◀", 
+                                  bg="#27ae60", fg="white",
+                                  font=("Arial", 14))
+        callout._arrow.place(x=5, y=50)
+        return callout
+    
     def create_feature_callout(self, feature_name: str, description: str, 
                              target_widget, action_text: str = "Try it!"):
         """Create a callout highlighting a specific feature"""
-        try:
-            # Position near the target widget
-            x = target_widget.winfo_rootx()
-            y = target_widget.winfo_rooty()
-            width = target_widget.winfo_width()
-            height = target_widget.winfo_height()
-            
-            callout = tk.Toplevel(self.root)
-            callout.title("")
-            callout.attributes("-topmost", True)
-            callout.overrideredirect(True)
-            
-            # Position to the right of target
-            callout.geometry(f"280x120+{x + width + 15}+{y}")
-            callout.configure(bg="#27ae60")
-            
-            # Feature name
-            name_label = tk.Label(callout, text=feature_name,
-                                bg="#27ae60", fg="white",
-                                font=("Arial", 12, "bold"))
-            name_label.pack(pady=5)
-            
-            # Description
-            desc_label = tk.Label(callout, text=description,
-                                bg="#27ae60", fg="white",
-                                font=("Arial", 9),
-                                wraplength=260,
-                                justify=tk.CENTER)
-            desc_label.pack(padx=10, pady=5)
-            
-            # Action button
-            action_btn = tk.Button(callout, text=action_text,
-                                 command=lambda: self.remove_overlay(callout),
-                                 bg="white", fg="#27ae60",
-                                 font=("Arial", 9, "bold"))
-            action_btn.pack(pady=5)
-            
-            # Add arrow pointing to target
-            arrow_label = tk.Label(callout, text="◀", 
-                                 bg="#27ae60", fg="white",
-                                 font=("Arial", 14))
-            arrow_label.place(x=5, y=50)
-            
-            self.overlays.append(callout)
-            
-            # Auto-remove after 10 seconds
-            self.root.after(10000, lambda: self.remove_overlay(callout))
-            
-            return callout
-            
-        except Exception:
+        if not self._alive or not target_widget.winfo_exists():
             return None
+        
+        # Position near the target widget
+        x, y, width, _ = _widget_bounds(target_widget)
+        
+        callout = self._get_overlay("callout", self._build_feature_callout)
+        
+        # Position to the right of target
+        _move(callout, x + width + 15, y)
+        
+        callout._name_label.configure(text=feature_name)
+        callout._desc_label.configure(text=description)
+        callout._action_btn.configure(text=action_text)
+        
+        # Auto-remove after 10 seconds
+        self._show(callout, self.overlays, 10000)
+        
+        return callout
     
     def remove_overlay(self, overlay):
-        """Remove a specific overlay"""
-        try:
-            if overlay in self.overlays:
-                self.overlays.remove(overlay)
-            overlay.destroy()
-        except Exception:
-            pass
+        """Hide a specific overlay so it can be reused"""
+        if overlay is self._inline_parts:
+            self._hide_inline_highlight(overlay)
+            return
+        self._cancel_hide(overlay)
+        self.overlays.pop(id(overlay), None)
+        if overlay.winfo_exists():
+            overlay.withdraw()
     
     def remove_tooltip(self, tooltip):
-        """Remove a specific tooltip"""
-        try:
-            if tooltip in self.tooltips:
-                self.tooltips.remove(tooltip)
-            tooltip.destroy()
-        except Exception:
-            pass
+        """Hide a specific tooltip so it can be reused"""
+        self._cancel_hide(tooltip)
+        self.tooltips.pop(id(tooltip), None)
+        if tooltip.winfo_exists():
+            tooltip.withdraw()
     
     def clear_all_overlays(self):
-        """Remove all overlays and tooltips"""
+        """Hide all overlays and tooltips and undo pending highlights"""
+        # Restore highlighted widgets now rather than when their timers fire
+        for widget, (_, after_id) in list(self._hl_state.items()):
+            self.root.after_cancel(after_id)
+            self._restore_highlight(widget)
+        
+        if self._inline_parts is not None:
+            self._hide_inline_highlight(self._inline_parts)
+        
         # Clear overlays
-        for overlay in self.overlays[:]:
-            try:
-                overlay.destroy()
-            except Exception:
-                pass
+        for overlay in list(self.overlays.values()):
+            self.remove_overlay(overlay)
         self.overlays.clear()
         
         # Clear tooltips
-        for tooltip in self.tooltips[:]:
-            try:
-                tooltip.destroy()
-            except Exception:
-                pass
+        for tooltip in list(self.tooltips.values()):
+            self.remove_tooltip(tooltip)
         self.tooltips.clear()
     
+    def _build_tutorial_navigation(self):
+        """Build the hidden Toplevel reused by create_tutorial_navigation"""
+        nav = _new_overlay(self.root, "#34495e", "300x60")
+        
+        # Navigation buttons, packed per call depending on the callbacks given
+        btn_frame = tk.Frame(nav, bg="#34495e")
+        btn_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        nav._prev_btn = tk.Button(btn_frame, text="← Previous",
+                                  bg="#95a5a6", fg="white")
+        nav._step_label = tk.Label(btn_frame, bg="#34495e", fg="white",
+                                   font=("Arial", 10))
+        nav._skip_btn = tk.Button(btn_frame, text="Skip",
+                                  bg="#e74c3c", fg="white")
+        nav._next_btn = tk.Button(btn_frame, bg="#3498db", fg="white")
+        return nav
+    
     def create_tutorial_navigation(self, on_next=None, on_prev=None, on_skip=None,
                                  current_step: int = 1, total_steps: int = 1):
         """Create navigation controls for tutorials"""
-        nav = tk.Toplevel(self.root)
-        nav.title("")
-        nav.attributes("-topmost", True)
-        nav.overrideredirect(True)
+        if not self._alive:
+            return None
+        
+        nav = self._get_overlay("nav", self._build_tutorial_navigation)
         
         # Position at bottom center
-        screen_width = self.root.winfo_screenwidth()
-        nav.geometry(f"300x60+{screen_width // 2 - 150}+{self.root.winfo_screenheight() - 100}")
-        nav.configure(bg="#34495e")
+        screen_width, screen_height = self._get_screen_size()
+        _move(nav, screen_width // 2 - 150, screen_height - 100)
         
-        # Navigation buttons
-        btn_frame = tk.Frame(nav, bg="#34495e")
-        btn_frame.pack(fill=tk.X, padx=10, pady=10)
+        for child in (nav._prev_btn, nav._step_label, nav._skip_btn, nav._next_btn):
+            child.pack_forget()
         
         # Previous button
         if on_prev and current_step > 1:
-            prev_btn = tk.Button(btn_frame, text="← Previous",
-                                command=on_prev,
-                                bg="#95a5a6", fg="white")
-            prev_btn.pack(side=tk.LEFT)
+            nav._prev_btn.configure(command=on_prev)
+            nav._prev_btn.pack(side=tk.LEFT)
         
         # Step indicator
-        step_label = tk.Label(btn_frame, text=f"{current_step}/{total_steps}",
-                            bg="#34495e", fg="white",
-                            font=("Arial", 10))
-        step_label.pack(side=tk.LEFT, expand=True)
+        nav._step_label.configure(text=f"{current_step}/{total_steps}")
+        nav._step_label.pack(side=tk.LEFT, expand=True)
         
         # Skip button
         if on_skip:
-            skip_btn = tk.Button(btn_frame, text="Skip",
-                               command=on_skip,
-                               bg="#e74c3c", fg="white")
-            skip_btn.pack(side=tk.RIGHT, padx=(5, 0))
+            nav._skip_btn.configure(command=on_skip)
+            nav._skip_btn.pack(side=tk.RIGHT, padx=(5, 0))
         
         # Next button
         if on_next:
             next_text = "Finish" if current_step == total_steps else "Next →"
-            next_btn = tk.Button(btn_frame, text=next_text,
-                               command=on_next,
-                               bg="#3498db", fg="white")
-            next_btn.pack(side=tk.RIGHT)
+            nav._next_btn.configure(text=next_text, command=on_next)
+            nav._next_btn.pack(side=tk.RIGHT)
         
-        self.overlays.append(nav)
+        self._show(nav, self.overlays)
         return nav
 
 
 class TutorialTooltipManager:
     """Manages contextual tooltips that appear when hovering over UI elements"""
     
+    # Tooltip definitions for UI elements, shared by every manager
+    _TOOLTIP_DATA = {
+        "new_server_button": MappingProxyType({
+            "text": "Click here to create a new Minecraft server!\nChoose from Vanilla, Forge, Fabric, Paper, and more.",
+            "position": "bottom"
+        }),
+        "mod_browser": MappingProxyType({
+            "text": "Browse and install mods directly from Modrinth.\nSupports Forge, Fabric, and Quilt mods.",
+            "position": "right"
+        }),
+        "backup_button": MappingProxyType({
+            "text": "Create backups of your server worlds.\nAlways backup before installing mods!",
+            "position": "top"
+        }),
+        "network_tab": MappingProxyType({
+            "text": "Configure port forwarding and firewall settings\nto let friends connect to your server.",
+            "position": "bottom"
+        })
+    }
+    
     def __init__(self, root_window):
         self.root = root_window
-        self.active_tooltips = {}
-        self.tooltip_data = self._load_tooltip_data()
-    
-    def _load_tooltip_data(self) -> Dict:
-        """Load tooltip definitions for UI elements"""
-        return {
-            "new_server_button": {
-                "text": "Click here to create a new Minecraft server!\nChoose from Vanilla, Forge, Fabric, Paper, and more.",
-                "position": "bottom"
-            },
-            "mod_browser": {
-                "text": "Browse and install mods directly from Modrinth.\nSupports Forge, Fabric, and Quilt mods.",
-                "position": "right"
-            },
-            "backup_button": {
-                "text": "Create backups of your server worlds.\nAlways backup before installing mods!",
-                "position": "top"
-            },
-            "network_tab": {
-                "text": "Configure port forwarding and firewall settings\nto let friends connect to your server.",
-                "position": "bottom"
-            }
-        }
+        self.tooltip_data = self._TOOLTIP_DATA
+        
+        # At most one tooltip is visible at a time, so every registered
+        # widget shares one Toplevel that is moved, shown and hidden
+        self._tooltip_widgets = {}  # widget path -> tooltip data
+        self._shared_tip = None
+        self._shared_label = None
+        
+        # One <Enter>/<Leave> binding on a bindtag shared by every tooltip
+        # widget; handlers dispatch on the event's widget path
+        self._bindtag = f"servmc_tip_{id(self)}"
+        self.root.bind_class(self._bindtag, "<Enter>", self._show_tooltip)
+        self.root.bind_class(self._bindtag, "<Leave>", self._hide_tooltip)
+        
+        self._alive = True
+        self.root.bind("<Destroy>", self._on_root_destroy, add="+")
+    
+    def _on_root_destroy(self, event):
+        """Stop showing tooltips once the root window goes away"""
+        if event.widget is self.root:
+            self._alive = False
     
     def add_tooltip(self, widget, tooltip_id: str):
         """Add a tooltip to a widget"""
@@ -393,54 +649,61 @@ class TutorialTooltipManager:
         if not tooltip_data:
             return
         
-        def show_tooltip(event):
-            tooltip = tk.Toplevel(self.root)
-            tooltip.title("")
-            tooltip.attributes("-topmost", True)
-            tooltip.overrideredirect(True)
-            
-            # Position tooltip based on preference
-            x = event.widget.winfo_rootx()
-            y = event.widget.winfo_rooty()
-            
-            if tooltip_data["position"] == "bottom":
-                y += event.widget.winfo_height() + 5
-            elif tooltip_data["position"] == "top":
-                y -= 60
-            elif tooltip_data["position"] == "right":
-                x += event.widget.winfo_width() + 5
-            
-            tooltip.geometry(f"+{x}+{y}")
-            tooltip.configure(bg="#2c3e50")
-            
-            text_label = tk.Label(tooltip, text=tooltip_data["text"],
-                                bg="#2c3e50", fg="white",
-                                font=("Arial", 9),
-                                justify=tk.LEFT,
-                                padx=8, pady=6)
-            text_label.pack()
-            
-            self.active_tooltips[widget] = tooltip
+        self._tooltip_widgets[str(widget)] = tooltip_data
+        bindtags = widget.bindtags()
+        if self._bindtag not in bindtags:
+            widget.bindtags(bindtags + (self._bindtag,))
+    
+    def _get_shared_tip(self):
+        """Return the shared tooltip Toplevel, building it on first use"""
+        if self._shared_tip is None or not self._shared_tip.winfo_exists():
+            self._shared_tip = _new_overlay(self.root, "#2c3e50")
+            
+            self._shared_label = tk.Label(self._shared_tip,
+                                          bg="#2c3e50", fg="white",
+                                          font=("Arial", 9),
+                                          justify=tk.LEFT,
+                                          padx=8, pady=6)
+            self._shared_label.pack()
+        return self._shared_tip
+    
+    def _show_tooltip(self, event):
+        """Move the shared tooltip to the hovered widget and show it"""
+        if not self._alive:
+            return
+        
+        tooltip_data = self._tooltip_widgets.get(str(event.widget))
+        if not tooltip_data:
+            return
+        
+        tooltip = self._get_shared_tip()
+        self._shared_label.configure(text=tooltip_data["text"])
+        
+        # Position tooltip based on preference
+        x, y, width, height = _widget_bounds(event.widget)
         
-        def hide_tooltip(event):
-            if widget in self.active_tooltips:
-                try:
-                    self.active_tooltips[widget].destroy()
-                    del self.active_tooltips[widget]
-                except Exception:
-                    pass
+        if tooltip_data["position"] == "bottom":
+            y += height + 5
+        elif tooltip_data["position"] == "top":
+            y -= 60
+        elif tooltip_data["position"] == "right":
+            x += width + 5
         
-        widget.bind("<Enter>", show_tooltip)
-        widget.bind("<Leave>", hide_tooltip)
+        _move(tooltip, x, y)
+        tooltip.update_idletasks()
+        tooltip.deiconify()
+    
+    def _hide_tooltip(self, event=None):
+        """Hide the shared tooltip"""
+        if self._shared_tip is not None and self._shared_tip.winfo_exists():
+            self._shared_tip.withdraw()
     
     def clear_all_tooltips(self):
-        """Remove all active tooltips"""
-        for tooltip in self.active_tooltips.values():
-            try:
-                tooltip.destroy()
-            except Exception:
-                pass
-        self.active_tooltips.clear()
+        """Destroy the shared tooltip"""
+        if self._shared_tip is not None and self._shared_tip.winfo_exists():
+            self._shared_tip.destroy()
+        self._shared_tip = None
+        self._shared_label = None
 
 
 def create_visual_tutorial_system(root_window):
@@ -2,15 +2,23 @@
 Modern Web Interface for ServMC
 """
 
+import atexit
+import io
 import os
+import heapq
+import itertools
 import json
+import logging
+import logging.handlers
+import queue
 import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for, flash, current_app
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+from flask import Flask, Response, render_template, request, send_file, redirect, url_for, flash, current_app
 from flask_socketio import SocketIO, emit
-import tempfile
+from jinja2 import FileSystemBytecodeCache
 import zipfile
 import qrcode
 from io import BytesIO
@@ -18,6 +26,258 @@ import base64
 from functools import lru_cache
 import asyncio
 
+logger = logging.getLogger('servmc.web')
+
+try:
+    import orjson
+    
+    def _dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    # Fallback to the standard library encoder
+    def _dumps(obj, indent: bool = False) -> bytes:
+        if indent:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+try:
+    from zlib_ng import zlib_ng
+    
+    # zipfile reaches its DEFLATE backend through these module globals.
+    # zlib-ng writes the same format with SIMD match finding and CRC
+    zipfile.zlib = zlib_ng
+    zipfile.crc32 = zlib_ng.crc32
+except ImportError:
+    pass
+
+
+# Listener writing queued log records, and the root handlers it took over
+_log_listener = None
+_root_handlers = []
+
+
+def _start_log_listener():
+    """Write log records from a listener thread via a queue"""
+    global _log_listener, _root_handlers
+    # Request threads only enqueue records and never block on the console.
+    # The root logger's handlers move behind the queue, so records still
+    # propagate to them as before
+    if _log_listener is not None:
+        return
+    
+    root = logging.getLogger()
+    _root_handlers = root.handlers[:]
+    handlers = _root_handlers
+    if not handlers:
+        console = logging.StreamHandler()
+        console.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+        handlers = [console]
+    
+    log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers,
+                                                   respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_stop_log_listener)
+    
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
+
+
+def _stop_log_listener():
+    """Flush queued log records and give the root logger its handlers back"""
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    _log_listener = None
+    logging.getLogger().handlers = _root_handlers
+
+
+def _json(obj, status: int = 200):
+    """Build a JSON response, using orjson when it is available"""
+    return _json_bytes(_dumps(obj), status)
+
+
+def _json_bytes(body: bytes, status: int = 200):
+    """Build a JSON response from an already encoded body"""
+    return current_app.response_class(body, status=status, mimetype='application/json')
+
+
+# Fields api_create_server requires in its JSON body
+_CREATE_SERVER_FIELDS = ("name", "version", "server_type", "port", "memory")
+
+
+def _select_async_mode(requested: str) -> str:
+    """Return the SocketIO async mode to use, falling back to threading.
+    
+    eventlet/gevent are only used when the process was already patched at
+    startup (see servmc.web_main); patching here would be too late.
+    """
+    if requested == 'eventlet':
+        try:
+            from eventlet import patcher
+            if patcher.is_monkey_patched('socket'):
+                return 'eventlet'
+        except ImportError:
+            pass
+    elif requested == 'gevent':
+        try:
+            from gevent import monkey
+            if monkey.is_module_patched('socket'):
+                return 'gevent'
+        except ImportError:
+            pass
+    if requested != 'threading':
+        logger.warning("web_async_mode %r is not installed or not patched at startup, "
+                       "using threading", requested)
+    return 'threading'
+
+
+
+@lru_cache(maxsize=256)
+def _render_qr(data: str) -> str:
+    """Render a QR code for data as a PNG data URI (pure, so cached)"""
+    qr = qrcode.QRCode(version=1, box_size=10, border=5)
+    qr.add_data(data)
+    qr.make(fit=True)
+    
+    img = qr.make_image(fill_color="black", back_color="white")
+    
+    # Convert to base64
+    buffer = BytesIO()
+    img.save(buffer, format='PNG')
+    img_str = base64.b64encode(buffer.getvalue()).decode()
+    
+    return f"data:image/png;base64,{img_str}"
+
+
+# Read size and minimum response chunk when streaming a zip; 1 MiB keeps
+# syscalls and WSGI writes few and large
+_COPY_CHUNK = 1024 * 1024
+
+# Connectivity of a port is refreshed while its network info was requested
+# within this many seconds
+_CONNECTIVITY_INTEREST = 300
+
+# Client packages up to this size are kept in memory rather than on disk
+_MEMORY_PACKAGE_LIMIT = 16 * 1024 * 1024
+
+# Total bytes of in-memory client packages; least recently used go first
+_MEMORY_PACKAGE_BUDGET = 64 * 1024 * 1024
+
+# Entries up to this size are stored; deflate headers would outweigh savings
+_SMALL_ENTRY_SIZE = 1024
+
+# Larger entries are streamed stored rather than read whole to be deflated
+_DEFLATE_ENTRY_LIMIT = _COPY_CHUNK
+
+# Files copied from the server directory into a client package, in order
+# as (name, type, description)
+_CLIENT_PACKAGE_FILES = (
+    ("{server_name}_MultiMC_Instance.zip", "multimc_instance", "Ready-to-import MultiMC instance"),
+    ("CLIENT_SETUP.md", "setup_guide", "Client setup instructions"),
+    ("Launch_Client.bat", "launcher", "Client launcher script"),
+    ("launch_client.sh", "launcher", "Client launcher script"),
+)
+
+# Already compressed formats are stored as-is; deflating them again costs
+# a full compression pass for almost no size reduction
+_STORED_EXTENSIONS = frozenset({'.zip', '.jar', '.png', '.jpg', '.gz', '.xz', '.7z'})
+
+
+def _small_zip_entry(arcname: str) -> zipfile.ZipInfo:
+    """ZipInfo for a small generated entry: stored, fixed date, rw-r--r--"""
+    zinfo = zipfile.ZipInfo(arcname, date_time=(1980, 1, 1, 0, 0, 0))
+    zinfo.compress_type = zipfile.ZIP_STORED
+    zinfo.external_attr = 0o644 << 16
+    return zinfo
+
+
+class _ZipStreamSink(io.RawIOBase):
+    """Write-only, unseekable stream collecting what ZipFile writes to it"""
+    
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self.pending = 0
+    
+    def writable(self):
+        return True
+    
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self.pending += len(data)
+        return len(data)
+    
+    def drain(self) -> bytes:
+        """Return and forget everything written since the last drain"""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self.pending = 0
+        return data
+
+
+class _TTLCache:
+    """Small LRU cache whose entries also expire after a fixed TTL"""
+    
+    def __init__(self, maxsize: int, ttl: float, timer=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self._data = OrderedDict()
+        # Min-heap of (expiry, seq, key) so expired entries are dropped
+        # from the front without scanning the whole cache
+        self._expiry_heap = []
+        self._seq = itertools.count()
+        # Shared by Werkzeug's threaded request handlers
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expiry, value = entry
+            if self.timer() >= expiry:
+                self._data.pop(key, None)
+                return default
+            self._data.move_to_end(key)
+            return value
+    
+    def __setitem__(self, key, value):
+        with self._lock:
+            now = self.timer()
+            self._expire(now)
+            expiry = now + self.ttl
+            self._data[key] = (expiry, value)
+            self._data.move_to_end(key)
+            heapq.heappush(self._expiry_heap, (expiry, next(self._seq), key))
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def expire(self, now: Optional[float] = None):
+        """Drop every entry whose TTL has passed"""
+        with self._lock:
+            self._expire(self.timer() if now is None else now)
+    
+    def _expire(self, now: float):
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expiry, _, key = heapq.heappop(heap)
+            entry = self._data.get(key)
+            # Skip heap entries left behind by overwrites and LRU evictions
+            if entry is not None and entry[0] == expiry:
+                self._data.pop(key, None)
+    
+    def __len__(self):
+        return len(self._data)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._expiry_heap.clear()
+
 
 class ServMCWebInterface:
     """Modern web interface for ServMC"""
@@ -27,19 +287,51 @@ class ServMCWebInterface:
         self.mod_manager = mod_manager
         self.config = config
         
-        # Initialize caches as empty - will populate on demand
-        self._server_cache = {}
-        self._server_cache_time = {}
-        self._cache_duration = timedelta(seconds=5)
+        # Initialize caches as empty - will populate on demand. The server
+        # list is invalidated on changes and otherwise expires after 5s
+        self._servers_list = None
+        self._servers_expiry = 0.0
+        self._cache_duration = 5.0
+        
+        # Server types rarely change; fetched once per interface
+        self._server_types = None
+        
+        # Mod cache - bounded LRU with a 5 minute TTL
+        self._mod_cache = _TTLCache(maxsize=512, ttl=300)
+        
+        # Built client packages per server name: (inputs key, zip bytes or
+        # path), in LRU order with in-memory bytes bounded by the budget
+        self._package_cache = OrderedDict()
+        self._package_cache_bytes = 0
+        self._package_lock = threading.Lock()
+        self._package_dir = os.path.join(os.path.expanduser("~"), ".servmc", "client_packages")
+        self._package_prefix = self._package_dir + os.sep
+        # Level 1 is several times faster than zlib's default 6 for a nearly
+        # identical size on this mostly incompressible download
+        try:
+            compresslevel = int(self.config.get("web_compresslevel", 1))
+        except (TypeError, ValueError):
+            logger.warning("Invalid web_compresslevel, using 1")
+            compresslevel = 1
+        self._compresslevel = min(max(compresslevel, 0), 9)
+        
+        # Rendered HTML for pages that only depend on rarely changing data
+        self._rendered = {}
+        self._templates = {}
         
-        # Mod cache - lighter initialization
-        self._mod_cache = {}
-        self._mod_cache_time = {}
-        self._mod_cache_duration = timedelta(minutes=5)
+        # Network info refreshed by the background updater, so requests
+        # never wait on public IP lookups or port probes
+        self._cached_local_ip = None
+        self._cached_public_ip = None
+        self._cached_connectivity = {}
+        # Ports whose network info was requested, by monotonic request time;
+        # only these have their connectivity probed
+        self._connectivity_requested = {}
         
         # Rate limiting for WebSocket updates
-        self._last_status_update = datetime.now()
-        self._min_update_interval = timedelta(seconds=3)  # Slower updates
+        self._last_status_update = time.monotonic()
+        self._min_update_interval = 3.0  # Slower updates
+        self._last_statuses = None
         
         # Flask app setup with minimal overhead
         self.app = Flask(__name__, 
@@ -56,10 +348,22 @@ class ServMCWebInterface:
             'EXPLAIN_TEMPLATE_LOADING': False
         })
         
-        # Lightweight SocketIO setup
+        # Behind nginx/Apache, let the proxy send files from disk (zero-copy)
+        self.app.use_x_sendfile = bool(self.config.get("web_use_x_sendfile", False))
+        
+        # Keep compiled templates on disk so restarts skip parsing them again
+        jinja_cache_dir = os.path.join(os.path.expanduser("~"), ".servmc", "jinja_cache")
+        os.makedirs(jinja_cache_dir, exist_ok=True)
+        self.app.jinja_env.auto_reload = False
+        self.app.jinja_env.cache_size = 400
+        self.app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=jinja_cache_dir)
+        
+        # Lightweight SocketIO setup - eventlet/gevent multiplex all clients
+        # on one loop when enabled in the config and patched at startup
+        async_mode = _select_async_mode(self.config.get("web_async_mode", "threading"))
         self.socketio = SocketIO(self.app, 
                                cors_allowed_origins="*",
-                               async_mode='threading',
+                               async_mode=async_mode,
                                ping_timeout=60,  # Longer timeout
                                ping_interval=25,  # Less frequent pings
                                max_http_buffer_size=500000)  # Smaller buffer
@@ -71,44 +375,52 @@ class ServMCWebInterface:
         # Defer background tasks until after startup
         self._background_tasks_started = False
     
-    @lru_cache(maxsize=32)
     def get_cached_server_types(self):
         """Cache server types to avoid repeated API calls"""
-        return self.mod_manager.get_available_server_types()
+        server_types = self._server_types
+        if server_types is None:
+            server_types = self._server_types = tuple(self.mod_manager.get_available_server_types())
+        return server_types
     
     def get_cached_servers(self, force_refresh=False):
         """Get servers with caching"""
-        now = datetime.now()
-        if force_refresh or not self._server_cache or \
-           (now - self._server_cache_time.get('servers', now)) > self._cache_duration:
-            servers = self.server_manager.get_servers()
-            self._server_cache['servers'] = servers
-            self._server_cache_time['servers'] = now
-        return self._server_cache.get('servers', [])
-    
-    def get_cached_mods(self, query: str, version: str, loader: str, limit: int) -> Optional[Dict]:
-        """Get cached mod search results"""
-        cache_key = f"{query}:{version}:{loader}:{limit}"
-        now = datetime.now()
-        
-        if cache_key in self._mod_cache and \
-           (now - self._mod_cache_time.get(cache_key, now)) <= self._mod_cache_duration:
-            return self._mod_cache[cache_key]
-        return None
+        now = time.monotonic()
+        if force_refresh or self._servers_list is None or now >= self._servers_expiry:
+            self._servers_list = self.server_manager.get_servers()
+            self._servers_expiry = now + self._cache_duration
+        return self._servers_list
     
-    def cache_mods(self, query: str, version: str, loader: str, limit: int, results: Dict):
-        """Cache mod search results"""
-        cache_key = f"{query}:{version}:{loader}:{limit}"
-        self._mod_cache[cache_key] = results
-        self._mod_cache_time[cache_key] = datetime.now()
-        
-        # Cleanup old cache entries
-        now = datetime.now()
-        expired_keys = [k for k, t in self._mod_cache_time.items() 
-                       if (now - t) > self._mod_cache_duration]
-        for k in expired_keys:
-            del self._mod_cache[k]
-            del self._mod_cache_time[k]
+    def _invalidate_servers(self):
+        """Drop the cached server list after a change"""
+        self._servers_list = None
+    
+    def get_cached_mods(self, query: str, version: str, loader: str, limit: int,
+                        kind: str = "search") -> Optional[bytes]:
+        """Get cached mod search results as encoded JSON"""
+        return self._mod_cache.get((kind, query, version, loader, limit))
+    
+    def cache_mods(self, query: str, version: str, loader: str, limit: int, results: Dict,
+                   kind: str = "search") -> bytes:
+        """Cache mod search results, encoded once so cache hits skip JSON encoding"""
+        body = _dumps(results)
+        # Expired and least recently used entries are evicted by the cache
+        self._mod_cache[(kind, query, version, loader, limit)] = body
+        return body
+    
+    def _template(self, name: str):
+        """Resolve a template through the Jinja loader once and reuse it"""
+        template = self._templates.get(name)
+        if template is None:
+            template = self._templates[name] = self.app.jinja_env.get_template(name)
+        return template
+    
+    def _cached_render(self, template: str, cache_key, **context) -> str:
+        """Render a template once and reuse the HTML until the cache is cleared"""
+        html = self._rendered.get(cache_key)
+        if html is None:
+            html = render_template(self._template(template), **context)
+            self._rendered[cache_key] = html
+        return html
     
     def setup_routes(self):
         """Setup Flask routes"""
@@ -125,7 +437,7 @@ class ServMCWebInterface:
             if hasattr(request, 'start_time'):  # Skip for static files
                 duration = time.time() - request.start_time
                 if duration > 1.0:  # Log slow requests
-                    print(f"Slow request: {request.path} took {duration:.2f}s")
+                    logger.warning("Slow request: %s took %.2fs", request.path, duration)
             return response
         
         @self.app.route('/')
@@ -140,7 +452,7 @@ class ServMCWebInterface:
             # Basic network status - will be updated asynchronously
             network_status = {"local_ip": "Loading...", "public_ip": "Loading..."}
             
-            return render_template('dashboard.html', 
+            return render_template(self._template('dashboard.html'), 
                                  servers=servers,
                                  total_servers=total_servers,
                                  running_servers=running_servers,
@@ -163,43 +475,75 @@ class ServMCWebInterface:
                 }
                 server_info.append(server_data)
             
-            return jsonify(server_info)
+            return _json(server_info)
         
         @self.app.route('/api/servers/<server_name>/start', methods=['POST'])
         def api_start_server(server_name):
             """Start a server"""
             try:
-                # Start server with output callback for real-time logs
+                # Start server with output callback for real-time logs. Lines
+                # are buffered and sent in ~50 ms batches, one frame per batch
+                log_lines = []
+                log_lock = threading.Lock()
+                
                 def output_callback(line):
-                    self.socketio.emit('server_log', {
-                        'server': server_name,
-                        'message': line,
-                        'timestamp': datetime.now().isoformat()
-                    })
+                    with log_lock:
+                        log_lines.append(line)
+                
+                def emit_logs():
+                    with log_lock:
+                        lines = log_lines[:]
+                        log_lines.clear()
+                    if lines:
+                        self.socketio.emit('server_log_batch', {
+                            'server': server_name,
+                            'lines': lines,
+                            'timestamp': datetime.now().isoformat()
+                        })
+                    return bool(lines)
+                
+                def flush_logs():
+                    idle_windows = 0
+                    # Keep flushing until the server is gone and no output has
+                    # arrived for about a second (its final lines come late)
+                    while idle_windows < 20:
+                        self.socketio.sleep(0.05)
+                        if emit_logs():
+                            idle_windows = 0
+                        elif not self.server_manager.is_server_running(server_name):
+                            idle_windows += 1
                 
                 success = self.server_manager.start_server(server_name, output_callback)
+                self._invalidate_servers()
+                if success:
+                    self.socketio.start_background_task(flush_logs)
+                else:
+                    # A failed start (e.g. a missing jar) has written all it
+                    # will; an already running server belongs to another flusher
+                    emit_logs()
                 
                 if success:
-                    return jsonify({"success": True, "message": f"Server {server_name} started successfully"})
+                    return _json({"success": True, "message": f"Server {server_name} started successfully"})
                 else:
-                    return jsonify({"success": False, "message": f"Failed to start server {server_name}"}), 400
+                    return _json({"success": False, "message": f"Failed to start server {server_name}"}, 400)
                     
             except Exception as e:
-                return jsonify({"success": False, "message": str(e)}), 500
+                return _json({"success": False, "message": str(e)}, 500)
         
         @self.app.route('/api/servers/<server_name>/stop', methods=['POST'])
         def api_stop_server(server_name):
             """Stop a server"""
             try:
                 success = self.server_manager.stop_server(server_name)
+                self._invalidate_servers()
                 
                 if success:
-                    return jsonify({"success": True, "message": f"Server {server_name} stopped successfully"})
+                    return _json({"success": True, "message": f"Server {server_name} stopped successfully"})
                 else:
-                    return jsonify({"success": False, "message": f"Failed to stop server {server_name}"}), 400
+                    return _json({"success": False, "message": f"Failed to stop server {server_name}"}, 400)
                     
             except Exception as e:
-                return jsonify({"success": False, "message": str(e)}), 500
+                return _json({"success": False, "message": str(e)}, 500)
         
         @self.app.route('/servers/<server_name>')
         def server_details(server_name):
@@ -210,7 +554,7 @@ class ServMCWebInterface:
                 return redirect(url_for('index'))
             
             # Load basic data first, details will load asynchronously
-            return render_template('server_details.html',
+            return render_template(self._template('server_details.html'),
                                  server=server,
                                  mods=[],  # Will be loaded asynchronously
                                  connectivity={},  # Will be loaded asynchronously
@@ -220,35 +564,42 @@ class ServMCWebInterface:
         def create_server_page():
             """Create server page - use cached data"""
             server_types = self.get_cached_server_types()
-            return render_template('create_server.html', server_types=server_types)
+            return self._cached_render('create_server.html', ('create', id(server_types)),
+                                       server_types=server_types)
         
         @self.app.route('/api/servers/create', methods=['POST'])
         def api_create_server():
             """Create a new server"""
             try:
-                data = request.get_json()
+                data = request.get_json(silent=True)
+                if not isinstance(data, dict):
+                    return _json({"success": False, "message": "Expected a JSON object"}, 400)
                 
                 # Validate required fields
-                required_fields = ["name", "version", "server_type", "port", "memory"]
-                for field in required_fields:
-                    if field not in data:
-                        return jsonify({"success": False, "message": f"Missing field: {field}"}), 400
+                missing = [field for field in _CREATE_SERVER_FIELDS if field not in data]
+                if missing:
+                    return _json({"success": False, "message": f"Missing field: {missing[0]}"}, 400)
                 
                 # Create server
                 success = self.server_manager.create_server(data)
+                self._invalidate_servers()
+                self._rendered.clear()
                 
                 if success:
-                    return jsonify({"success": True, "message": f"Server '{data['name']}' created successfully"})
+                    # The localhost QR only depends on the port; render it now
+                    # so the first network-info request finds it cached
+                    self.create_qr_code(f"localhost:{data['port']}")
+                    return _json({"success": True, "message": f"Server '{data['name']}' created successfully"})
                 else:
-                    return jsonify({"success": False, "message": "Failed to create server"}), 400
+                    return _json({"success": False, "message": "Failed to create server"}, 400)
                     
             except Exception as e:
-                return jsonify({"success": False, "message": str(e)}), 500
+                return _json({"success": False, "message": str(e)}, 500)
         
         @self.app.route('/mods')
         def mods_page():
             """Mods browser page"""
-            return render_template('mods.html')
+            return self._cached_render('mods.html', 'mods')
         
         @self.app.route('/api/mods/search')
         def api_search_mods():
@@ -262,7 +613,7 @@ class ServMCWebInterface:
                 # Check cache first
                 cached_results = self.get_cached_mods(query, version, loader, limit)
                 if cached_results:
-                    return jsonify(cached_results)
+                    return _json_bytes(cached_results)
                 
                 # If no cache, perform search
                 mods = self.mod_manager.search_mods_with_images(query, version, loader, limit)
@@ -277,23 +628,21 @@ class ServMCWebInterface:
                 }
                 
                 # Cache the results
-                self.cache_mods(query, version, loader, limit, results)
-                
-                return jsonify(results)
+                return _json_bytes(self.cache_mods(query, version, loader, limit, results))
                 
             except Exception as e:
-                print(f"Error in mod search API: {e}")
-                return jsonify({
+                logger.error("Error in mod search API: %s", e)
+                return _json({
                     "success": False,
                     "error": str(e),
                     "mods": [],
                     "total": 0
-                }), 500
+                }, 500)
         
         @self.app.route('/modpacks')
         def modpacks_page():
             """Modpacks browser page"""
-            return render_template('modpacks.html')
+            return self._cached_render('modpacks.html', 'modpacks')
         
         @self.app.route('/api/modpacks/search')
         def api_search_modpacks():
@@ -305,9 +654,9 @@ class ServMCWebInterface:
             
             try:
                 modpacks = self.mod_manager.search_modpacks(query, version, loader, limit)
-                return jsonify(modpacks)
+                return _json(modpacks)
             except Exception as e:
-                return jsonify({"error": str(e)}), 500
+                return _json({"error": str(e)}, 500)
         
         @self.app.route('/api/modpacks/<modpack_id>/install', methods=['POST'])
         def api_install_modpack(modpack_id):
@@ -317,12 +666,12 @@ class ServMCWebInterface:
                 server_name = data.get('server_name')
                 
                 if not server_name:
-                    return jsonify({"success": False, "message": "Server name required"}), 400
+                    return _json({"success": False, "message": "Server name required"}, 400)
                 
                 # Get modpack details
                 modpack_response = self.mod_manager.search_modpacks(modpack_id, limit=1)
                 if not modpack_response:
-                    return jsonify({"success": False, "message": "Modpack not found"}), 404
+                    return _json({"success": False, "message": "Modpack not found"}, 404)
                 
                 modpack = modpack_response[0]
                 
@@ -343,10 +692,10 @@ class ServMCWebInterface:
                 
                 threading.Thread(target=install_task, daemon=True).start()
                 
-                return jsonify({"success": True, "message": "Modpack installation started"})
+                return _json({"success": True, "message": "Modpack installation started"})
                 
             except Exception as e:
-                return jsonify({"success": False, "message": str(e)}), 500
+                return _json({"success": False, "message": str(e)}, 500)
         
         @self.app.route('/settings')
         def settings_page():
@@ -359,7 +708,7 @@ class ServMCWebInterface:
             except Exception:
                 network_status = {}
             
-            return render_template('settings.html', 
+            return render_template(self._template('settings.html'), 
                                  config=self.config.data,
                                  network_status=network_status)
         
@@ -367,16 +716,18 @@ class ServMCWebInterface:
         def api_update_settings():
             """Update settings"""
             try:
-                data = request.get_json()
+                data = request.get_json(silent=True)
+                if not isinstance(data, dict):
+                    return _json({"success": False, "message": "Expected a JSON object"}, 400)
                 
-                # Update configuration
-                for key, value in data.items():
-                    self.config.set(key, value)
+                # Update configuration - one save for the whole batch
+                self.config.update(data)
+                self._rendered.clear()
                 
-                return jsonify({"success": True, "message": "Settings updated successfully"})
+                return _json({"success": True, "message": "Settings updated successfully"})
                 
             except Exception as e:
-                return jsonify({"success": False, "message": str(e)}), 500
+                return _json({"success": False, "message": str(e)}, 500)
         
         @self.app.route('/servers/<server_name>/share')
         def share_server(server_name):
@@ -389,7 +740,7 @@ class ServMCWebInterface:
             # Generate sharing package
             share_package = self.create_server_share_package(server)
             
-            return render_template('share_server.html', 
+            return render_template(self._template('share_server.html'), 
                                  server=server,
                                  share_package=share_package)
         
@@ -399,17 +750,28 @@ class ServMCWebInterface:
             try:
                 server = self.server_manager.get_server_by_name(server_name)
                 if not server:
-                    return jsonify({"error": "Server not found"}), 404
+                    return _json({"error": "Server not found"}, 404)
                 
-                # Create client package
-                package_path = self.create_client_package(server)
+                # Serve an unchanged package from disk, otherwise stream a new
+                # one while it is being built
+                inputs = self._client_package_inputs(server)
+                package = self.get_cached_client_package(server, inputs)
+                if package is not None:
+                    if isinstance(package, bytes):
+                        package = BytesIO(package)
+                    return send_file(package,
+                                   mimetype='application/zip',
+                                   as_attachment=True,
+                                   download_name=f"{server_name}_client.zip",
+                                   conditional=True)
                 
-                return send_file(package_path, 
-                               as_attachment=True,
-                               download_name=f"{server_name}_client.zip")
+                return Response(self.create_client_package(server, inputs),
+                              mimetype='application/zip',
+                              headers={'Content-Disposition':
+                                       f'attachment; filename="{server_name}_client.zip"'})
                 
             except Exception as e:
-                return jsonify({"error": str(e)}), 500
+                return _json({"error": str(e)}, 500)
         
         @self.app.route('/api/servers/<server_name>/details')
         def api_server_details(server_name):
@@ -417,7 +779,7 @@ class ServMCWebInterface:
             try:
                 server = self.server_manager.get_server_by_name(server_name)
                 if not server:
-                    return jsonify({"error": "Server not found"}), 404
+                    return _json({"error": "Server not found"}, 404)
                 
                 # Get detailed info
                 running = self.server_manager.is_server_running(server_name)
@@ -443,10 +805,10 @@ class ServMCWebInterface:
                 except Exception:
                     pass
                 
-                return jsonify(details)
+                return _json(details)
                 
             except Exception as e:
-                return jsonify({"error": str(e)}), 500
+                return _json({"error": str(e)}, 500)
         
         @self.app.route('/api/servers/<server_name>/network-info')
         def api_server_network_info(server_name):
@@ -454,26 +816,23 @@ class ServMCWebInterface:
             try:
                 server = self.server_manager.get_server_by_name(server_name)
                 if not server:
-                    return jsonify({"error": "Server not found"}), 404
+                    return _json({"error": "Server not found"}, 404)
                 
-                # Get network info
-                try:
-                    from .network import get_network_manager
-                    network_manager = get_network_manager()
-                    connectivity = network_manager.test_connectivity(server.get('port', 25565))
-                except Exception:
-                    connectivity = {}
+                # Last known connectivity, refreshed in the background
+                port = server.get('port', 25565)
+                self._connectivity_requested[port] = time.monotonic()
+                connectivity = self._cached_connectivity.get(port, {})
                 
                 # Generate QR codes
                 qr_codes = self.generate_connection_qr_codes(server)
                 
-                return jsonify({
+                return _json({
                     "connectivity": connectivity,
                     "qr_codes": qr_codes
                 })
                 
             except Exception as e:
-                return jsonify({"error": str(e)}), 500
+                return _json({"error": str(e)}, 500)
         
         @self.app.route('/api/mods/popular')
         def api_popular_mods():
@@ -484,10 +843,9 @@ class ServMCWebInterface:
                 limit = min(int(request.args.get('limit', 30)), 50)
                 
                 # Check cache first
-                cache_key = f"popular:{version}:{loader}:{limit}"
-                cached_results = self.get_cached_mods("", version, loader, limit)
+                cached_results = self.get_cached_mods("", version, loader, limit, kind="popular")
                 if cached_results:
-                    return jsonify(cached_results)
+                    return _json_bytes(cached_results)
                 
                 # Get popular mods by searching without query (sorted by downloads)
                 mods = self.mod_manager.search_mods_with_images("", version, loader, limit)
@@ -503,31 +861,32 @@ class ServMCWebInterface:
                 }
                 
                 # Cache the results
-                self.cache_mods("", version, loader, limit, results)
-                
-                return jsonify(results)
+                return _json_bytes(self.cache_mods("", version, loader, limit, results,
+                                                  kind="popular"))
                 
             except Exception as e:
-                print(f"Error loading popular mods: {e}")
-                return jsonify({
+                logger.error("Error loading popular mods: %s", e)
+                return _json({
                     "success": False,
                     "error": str(e),
                     "mods": [],
                     "total": 0,
                     "type": "popular"
-                }), 500
+                }, 500)
     
     def setup_websocket_handlers(self):
         """Setup WebSocket handlers for real-time updates"""
         
         @self.socketio.on('connect')
         def handle_connect():
-            print("Client connected to WebSocket")
+            logger.info("Client connected to WebSocket")
             emit('status', {'message': 'Connected to ServMC'})
+            if self._last_statuses:
+                emit('server_status_update', self._last_statuses)
         
         @self.socketio.on('disconnect')
         def handle_disconnect():
-            print("Client disconnected from WebSocket")
+            logger.info("Client disconnected from WebSocket")
         
         @self.socketio.on('subscribe_server_logs')
         def handle_subscribe_logs(data):
@@ -546,52 +905,70 @@ class ServMCWebInterface:
             """Lightweight periodic status updates"""
             while True:
                 try:
-                    now = datetime.now()
-                    if (now - self._last_status_update) >= self._min_update_interval:
+                    now = time.monotonic()
+                    if now - self._last_status_update >= self._min_update_interval:
                         servers = self.get_cached_servers()
                         
-                        # Only check if servers are running (lightweight check)
-                        server_statuses = []
-                        for server in servers:
-                            server_name = server.get('name', '')
-                            try:
-                                running = self.server_manager.is_server_running(server_name)
-                                status = {
-                                    'name': server_name,
-                                    'running': running
-                                }
-                                server_statuses.append(status)
-                            except Exception:
-                                # Skip problematic servers
-                                continue
+                        # Only check if servers are running - an in-memory
+                        # lookup, so one pass beats fanning out to threads
+                        is_running = self.server_manager.is_server_running
+                        server_statuses = [
+                            {'name': name, 'running': is_running(name)}
+                            for name in (server.get('name', '') for server in servers)
+                        ]
                         
-                        # Only emit if we have data
-                        if server_statuses:
+                        # Only broadcast when something changed; new clients
+                        # get the last statuses when they connect
+                        if server_statuses and server_statuses != self._last_statuses:
                             self.socketio.emit('server_status_update', server_statuses)
+                            self._last_statuses = server_statuses
                         
                         self._last_status_update = now
+                        self._purge_client_packages(servers)
                     
                 except Exception as e:
-                    print(f"Error in status updater: {e}")
+                    logger.error("Error in status updater: %s", e)
                 
-                time.sleep(3)  # Slower updates to reduce load
+                self.socketio.sleep(3)  # Slower updates to reduce load
         
         def network_info_updater():
             """Separate thread for network info updates (less frequent)"""
             while True:
                 try:
-                    from .network import get_network_manager
+                    from .network import get_network_manager, NetworkUtils
                     network_manager = get_network_manager()
                     status = network_manager.get_network_status()
+                    local_ip = self._cached_local_ip = status.get("local_ip")
+                    public_ip = self._cached_public_ip = status.get("public_ip")
                     self.socketio.emit('network_status_update', status)
+                    
+                    # Probe only ports still in use whose info was viewed
+                    # recently, reusing the addresses looked up above
+                    ports = {server.get('port', 25565) for server in self.get_cached_servers()}
+                    since = time.monotonic() - _CONNECTIVITY_INTEREST
+                    for port in list(self._connectivity_requested):
+                        if port not in ports or self._connectivity_requested[port] < since:
+                            self._connectivity_requested.pop(port, None)
+                    for port in list(self._cached_connectivity):
+                        if port not in self._connectivity_requested:
+                            self._cached_connectivity.pop(port, None)
+                    
+                    for port in list(self._connectivity_requested):
+                        self._cached_connectivity[port] = {
+                            "local_reachable": NetworkUtils.check_port_open("127.0.0.1", port),
+                            "lan_reachable": NetworkUtils.check_port_open(local_ip, port)
+                                             if local_ip and local_ip != "127.0.0.1" else False,
+                            "internet_reachable": NetworkUtils.check_port_open(public_ip, port)
+                                                  if public_ip else False
+                        }
                 except Exception:
                     pass
                 
-                time.sleep(30)  # Update network info every 30 seconds
+                self.socketio.sleep(30)  # Update network info every 30 seconds
         
-        # Start background tasks
-        threading.Thread(target=lightweight_status_updater, daemon=True).start()
-        threading.Thread(target=network_info_updater, daemon=True).start()
+        # Start background tasks with the SocketIO async mode's primitives
+        self.socketio.start_background_task(lightweight_status_updater)
+        self.socketio.start_background_task(network_info_updater)
     
     def generate_connection_qr_codes(self, server: Dict) -> Dict:
         """Generate QR codes for easy server connection"""
@@ -599,8 +976,9 @@ class ServMCWebInterface:
             from .network import NetworkUtils
             
             server_port = server.get('port', 25565)
-            local_ip = NetworkUtils.get_local_ip()
-            public_ip = NetworkUtils.get_public_ip()
+            # The local IP lookup is cheap; the public one waits for the updater
+            local_ip = self._cached_local_ip or NetworkUtils.get_local_ip()
+            public_ip = self._cached_public_ip
             
             qr_codes = {}
             
@@ -621,27 +999,15 @@ class ServMCWebInterface:
             return qr_codes
             
         except Exception as e:
-            print(f"Error generating QR codes: {e}")
+            logger.error("Error generating QR codes: %s", e)
             return {}
     
     def create_qr_code(self, data: str) -> str:
         """Create QR code and return as base64 string"""
         try:
-            qr = qrcode.QRCode(version=1, box_size=10, border=5)
-            qr.add_data(data)
-            qr.make(fit=True)
-            
-            img = qr.make_image(fill_color="black", back_color="white")
-            
-            # Convert to base64
-            buffer = BytesIO()
-            img.save(buffer, format='PNG')
-            img_str = base64.b64encode(buffer.getvalue()).decode()
-            
-            return f"data:image/png;base64,{img_str}"
-            
+            return _render_qr(data)
         except Exception as e:
-            print(f"Error creating QR code: {e}")
+            logger.error("Error creating QR code: %s", e)
             return ""
     
     def create_server_share_package(self, server: Dict) -> Dict:
@@ -671,89 +1037,220 @@ class ServMCWebInterface:
             }
             
             # Check for available files
-            server_path = server.get("path", "")
-            if server_path and os.path.exists(server_path):
-                # MultiMC instance
-                multimc_zip = os.path.join(server_path, f"{server['name']}_MultiMC_Instance.zip")
-                if os.path.exists(multimc_zip):
-                    package["files"].append({
-                        "type": "multimc_instance",
-                        "name": f"{server['name']}_MultiMC_Instance.zip",
-                        "description": "Ready-to-import MultiMC instance",
-                        "path": multimc_zip
-                    })
-                
-                # Setup guide
-                setup_guide = os.path.join(server_path, "CLIENT_SETUP.md")
-                if os.path.exists(setup_guide):
-                    package["files"].append({
-                        "type": "setup_guide",
-                        "name": "CLIENT_SETUP.md",
-                        "description": "Client setup instructions",
-                        "path": setup_guide
-                    })
-                
-                # Launcher scripts
-                for script_name in ["Launch_Client.bat", "launch_client.sh"]:
-                    script_path = os.path.join(server_path, script_name)
-                    if os.path.exists(script_path):
-                        package["files"].append({
-                            "type": "launcher",
-                            "name": script_name,
-                            "description": "Client launcher script",
-                            "path": script_path
-                        })
+            for entry, name, file_type, description in self._find_client_files(server):
+                package["files"].append({
+                    "type": file_type,
+                    "name": name,
+                    "description": description,
+                    "path": entry.path
+                })
             
         except Exception as e:
-            print(f"Error creating share package: {e}")
+            logger.error("Error creating share package: %s", e)
         
         return package
     
-    def create_client_package(self, server: Dict) -> str:
-        """Create a downloadable client package"""
+    def _find_client_files(self, server: Dict) -> List[tuple]:
+        """Return (DirEntry, name, type, description) for each client file present"""
+        server_name = server.get("name", "server")
+        server_path = server.get("path", "")
+        
+        # One directory scan finds every available file; entries carry their
+        # own full path, so no per-candidate join or stat is needed
+        entries = {}
+        if server_path:
+            try:
+                with os.scandir(server_path) as it:
+                    entries = {entry.name: entry for entry in it if entry.is_file()}
+            except OSError:
+                pass
+        
+        found = []
+        for name, file_type, description in _CLIENT_PACKAGE_FILES:
+            name = name.format(server_name=server_name)
+            entry = entries.get(name)
+            if entry is not None:
+                found.append((entry, name, file_type, description))
+        return found
+    
+    def _client_package_inputs(self, server: Dict) -> tuple:
+        """Collect the connection info, files and cache key of a client package"""
+        server_name = server.get("name", "server")
+        
+        connection_info = {
+            "server_name": server_name,
+            "version": server.get("version"),
+            "server_type": server.get("server_type"),
+            "port": server.get("port", 25565),
+            "instructions": "Use the provided MultiMC instance or follow the setup guide"
+        }
+        payload = _dumps(connection_info, indent=True)
+        
+        files = []
+        mtimes = []
+        size = len(payload)
+        for entry, arcname, _, _ in self._find_client_files(server):
+            stat = entry.stat()
+            files.append((entry.path, arcname))
+            mtimes.append((arcname, stat.st_mtime_ns, stat.st_size))
+            size += stat.st_size
+        
+        # The package only changes with the connection info or an input's
+        # mtime or size; size catches rewrites within the mtime granularity
+        key = (payload, tuple(mtimes))
+        return payload, files, key, size
+    
+    def get_cached_client_package(self, server: Dict, inputs: tuple):
+        """Return the bytes or file path of a built package that is still current"""
+        server_name = server.get("name", "server")
+        with self._package_lock:
+            cached = self._package_cache.get(server_name)
+            if cached and cached[0] == inputs[2] and \
+               (isinstance(cached[1], bytes) or os.path.exists(cached[1])):
+                self._package_cache.move_to_end(server_name)
+                return cached[1]
+        return None
+    
+    def _store_client_package(self, server_name: str, key: tuple, package):
+        """Remember a built package, evicting old in-memory ones over the budget"""
+        with self._package_lock:
+            self._drop_cached_package(server_name)
+            self._package_cache[server_name] = (key, package)
+            if isinstance(package, bytes):
+                self._package_cache_bytes += len(package)
+            # Packages on disk cost no memory and are never evicted here
+            for name in [name for name, (_, cached) in self._package_cache.items()
+                         if isinstance(cached, bytes)]:
+                if self._package_cache_bytes <= _MEMORY_PACKAGE_BUDGET or name == server_name:
+                    break
+                self._drop_cached_package(name)
+    
+    def _drop_cached_package(self, server_name: str):
+        """Remove a cache entry; the caller holds the package lock"""
+        cached = self._package_cache.pop(server_name, None)
+        if cached and isinstance(cached[1], bytes):
+            self._package_cache_bytes -= len(cached[1])
+        return cached
+    
+    def _purge_client_packages(self, servers: List[Dict]):
+        """Drop cached packages of servers that have been deleted"""
+        names = {server.get("name", "server") for server in servers}
+        with self._package_lock:
+            removed = [name for name in self._package_cache if name not in names]
+        for name in removed:
+            self._forget_client_package(name)
+    
+    def _forget_client_package(self, server_name: str):
+        """Drop the cached package of a removed server, in memory and on disk"""
+        with self._package_lock:
+            self._drop_cached_package(server_name)
         try:
-            server_name = server.get("name", "server")
-            server_path = server.get("path", "")
-            
-            # Create temporary zip file
-            with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as temp_file:
-                temp_path = temp_file.name
+            os.remove(f"{self._package_prefix}{server_name}_client.zip")
+        except OSError:
+            pass
+    
+    def create_client_package(self, server: Dict, inputs: Optional[tuple] = None) -> Iterator[bytes]:
+        """Open a client package's inputs and return its zip byte stream
+        
+        Every input is opened before anything is sent, so a missing or
+        unreadable file raises while the route can still answer with an
+        error instead of a truncated 200 response.
+        """
+        server_name = server.get("name", "server")
+        payload, files, key, size = inputs or self._client_package_inputs(server)
+        
+        if not files:
+            # Only the connection info to package: a tiny stored zip built in
+            # memory, with no deflate setup and no copy kept on disk
+            buffer = BytesIO()
+            with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zipf:
+                zipf.writestr(_small_zip_entry("connection_info.json"), payload)
+            return iter((buffer.getvalue(),))
+        
+        sources = []
+        try:
+            for path, arcname in files:
+                # from_file keeps the mtime and permission bits
+                # (launch_client.sh stays executable), as zipf.write would
+                zinfo = zipfile.ZipInfo.from_file(path, arcname)
+                sources.append((zinfo, open(path, 'rb', buffering=0)))
+        except OSError:
+            for _, src in sources:
+                src.close()
+            logger.exception("Error opening client package files for %s", server_name)
+            raise
+        
+        return self._stream_client_package(server_name, key, payload, sources, size)
+    
+    def _stream_client_package(self, server_name: str, key: tuple, payload: bytes,
+                               sources: List[tuple], size: int) -> Iterator[bytes]:
+        """Zip the opened inputs, yielding the bytes as they are produced"""
+        # A copy of the stream is kept so unchanged packages are served as-is
+        # next time instead of being rebuilt. Small packages (the usual case
+        # without a big MultiMC instance) stay in memory and never hit disk
+        package_path = f"{self._package_prefix}{server_name}_client.zip"
+        part_path = f"{package_path}.{threading.get_ident()}.part"
+        in_memory = size <= _MEMORY_PACKAGE_LIMIT
+        
+        # ZipFile writes into the sink and the bytes are yielded as they are
+        # produced, so the client does not wait for the whole archive
+        sink = _ZipStreamSink()
+        completed = False
+        try:
+            if in_memory:
+                cache_file = BytesIO()
+            else:
+                os.makedirs(self._package_dir, exist_ok=True)
+                cache_file = open(part_path, 'wb', buffering=_COPY_CHUNK)
             
-            with zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Add connection info
-                connection_info = {
-                    "server_name": server_name,
-                    "version": server.get("version"),
-                    "server_type": server.get("server_type"),
-                    "port": server.get("port", 25565),
-                    "instructions": "Use the provided MultiMC instance or follow the setup guide"
-                }
-                
-                zipf.writestr("connection_info.json", json.dumps(connection_info, indent=2))
-                
-                # Add available files
-                if server_path and os.path.exists(server_path):
-                    # MultiMC instance
-                    multimc_zip = os.path.join(server_path, f"{server_name}_MultiMC_Instance.zip")
-                    if os.path.exists(multimc_zip):
-                        zipf.write(multimc_zip, f"{server_name}_MultiMC_Instance.zip")
-                    
-                    # Setup guide
-                    setup_guide = os.path.join(server_path, "CLIENT_SETUP.md")
-                    if os.path.exists(setup_guide):
-                        zipf.write(setup_guide, "CLIENT_SETUP.md")
+            with cache_file:
+                with zipfile.ZipFile(sink, 'w', zipfile.ZIP_STORED,
+                                     compresslevel=self._compresslevel) as zipf:
+                    # Add connection info
+                    zipf.writestr(_small_zip_entry("connection_info.json"), payload)
                     
-                    # Launcher scripts
-                    for script_name in ["Launch_Client.bat", "launch_client.sh"]:
-                        script_path = os.path.join(server_path, script_name)
-                        if os.path.exists(script_path):
-                            zipf.write(script_path, script_name)
+                    for zinfo, src in sources:
+                        if _SMALL_ENTRY_SIZE < zinfo.file_size <= _DEFLATE_ENTRY_LIMIT and \
+                           os.path.splitext(zinfo.filename)[1].lower() not in _STORED_EXTENSIONS:
+                            # zipf.open(zinfo) ignores the archive's level, so
+                            # text entries are deflated whole through writestr
+                            with src:
+                                zipf.writestr(zinfo, src.read(), zipfile.ZIP_DEFLATED,
+                                              zipf.compresslevel)
+                            continue
+                        with src, zipf.open(zinfo, 'w') as dest:
+                            for chunk in iter(lambda: src.read(_COPY_CHUNK), b''):
+                                dest.write(chunk)
+                                # Small entries coalesce until a full chunk is ready
+                                if sink.pending >= _COPY_CHUNK:
+                                    data = sink.drain()
+                                    cache_file.write(data)
+                                    yield data
+                
+                # Remaining entry trailers and the central directory
+                data = sink.drain()
+                cache_file.write(data)
+                if in_memory:
+                    package = cache_file.getvalue()
             
-            return temp_path
+            if not in_memory:
+                os.replace(part_path, package_path)
+                package = package_path
+            completed = True
+            self._store_client_package(server_name, key, package)
+            yield data
             
-        except Exception as e:
-            print(f"Error creating client package: {e}")
+        except Exception:
+            # The response has already started, so a failure here can only be
+            # logged; the client sees the download end early
+            logger.exception("Error creating client package for %s", server_name)
             raise
+        finally:
+            for _, src in sources:
+                src.close()
+            # Aborted downloads and failed builds leave no partial file behind
+            if not completed and os.path.exists(part_path):
+                os.remove(part_path)
     
     def start_background_tasks(self):
         """Start background tasks - called after web interface is fully loaded"""
@@ -766,20 +1263,34 @@ class ServMCWebInterface:
         print(f"🌐 Starting ServMC Web Interface on http://{host}:{port}")
         print(f"📱 Mobile-friendly interface with real-time updates")
         print(f"🔧 Features: Server management, mod browser, automatic port forwarding")
+        _start_log_listener()
         
-        # Start background tasks after a delay to not block startup
+        # Start background tasks 2 seconds after startup to not block it; the
+        # timer's thread exits as soon as it has fired
         def delayed_startup():
-            time.sleep(2)  # Wait 2 seconds after startup
             self.start_background_tasks()
             print("✅ Background tasks started")
         
-        threading.Thread(target=delayed_startup, daemon=True).start()
+        startup_timer = threading.Timer(2.0, delayed_startup)
+        startup_timer.daemon = True
+        startup_timer.start()
         
-        self.socketio.run(self.app, 
-                         host=host, 
-                         port=port, 
-                         debug=debug,
-                         allow_unsafe_werkzeug=True)
+        # The async mode was fixed in __init__ from how the process was
+        # started (servmc.web_main patches before any thread or socket exists).
+        # eventlet/gevent serve requests from their own WSGI server; only the
+        # threading fallback needs Werkzeug's development server
+        run_options = {}
+        if self.socketio.async_mode == 'threading':
+            run_options['allow_unsafe_werkzeug'] = True
+        
+        try:
+            self.socketio.run(self.app, 
+                             host=host, 
+                             port=port, 
+                             debug=debug,
+                             **run_options)
+        finally:
+            _stop_log_listener()
 
 
 def create_web_interface(server_manager, mod_manager, config):
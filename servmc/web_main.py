@@ -0,0 +1,43 @@
+"""
+Standalone entry point for the ServMC web interface
+"""
+
+import os
+
+
+def _patch_for_async_mode(async_mode: str):
+    """Monkey-patch for eventlet/gevent before threads or sockets exist"""
+    try:
+        if async_mode == "eventlet":
+            import eventlet
+            eventlet.monkey_patch()
+        elif async_mode == "gevent":
+            from gevent import monkey
+            monkey.patch_all()
+    except ImportError:
+        # The web interface falls back to threading and logs a warning
+        pass
+
+
+def main():
+    """Run the web interface without the desktop GUI"""
+    # Only the config is loaded before patching; it imports nothing that
+    # starts threads or opens sockets
+    from .config import Config
+    
+    config_dir = os.path.join(os.path.expanduser("~"), ".servmc")
+    os.makedirs(config_dir, exist_ok=True)
+    config = Config(os.path.join(config_dir, "config.json"))
+    
+    _patch_for_async_mode(config.get("web_async_mode", "threading"))
+    
+    from .server import ServerManager
+    from .mod_manager import ModManager
+    from .web_interface import create_web_interface
+    
+    web_interface = create_web_interface(ServerManager(config), ModManager(config), config)
+    web_interface.run(port=config.get("web_port", 8080))
+
+
+if __name__ == "__main__":
+    main()
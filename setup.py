@@ -13,11 +13,30 @@ setup(
         "requests>=2.28.2",
         "pillow>=9.5.0",
         "ttkthemes>=3.2.2",
-        "mcstatus>=10.0.3"
+        "mcstatus>=10.0.3",
+        "schedule>=1.2.0"
     ],
+    extras_require={
+        "web": [
+            "flask>=2.2",
+            "flask-socketio>=5.3",
+            "qrcode>=7.4"
+        ],
+        "eventlet": [
+            "eventlet>=0.35"
+        ],
+        "gevent": [
+            "gevent>=23.9"
+        ],
+        "speedups": [
+            "orjson>=3.9",
+            "zlib-ng>=0.4"
+        ]
+    },
     entry_points={
         "console_scripts": [
             "servmc=servmc.servmc:main",
+            "servmc-web=servmc.web_main:main",
         ],
     },
     python_requires=">=3.8",